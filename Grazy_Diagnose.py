@@ -1,21 +1,87 @@
 import os
+import re
+import json
 import sys
+import atexit
 import subprocess
 import importlib
+import importlib.util
+import importlib.machinery
+import importlib.metadata
+import time
+import collections
+import threading
 import traceback
-from datetime import datetime
+import py_compile
+import compileall
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 LOG_DIR = Path("logs")
 LOG_FILE = LOG_DIR / "diagnostics.log"
+LOG_DIR.mkdir(exist_ok=True)
+# Results of the last requirements check; delete the file to force a fresh one.
+REQ_CACHE_FILE = LOG_DIR / "req_cache.json"
+
+_BUF = collections.deque()
+_STDOUT_BUF = []
+_LOG_LOCK = threading.Lock()
+# Per-thread capture list used while checks run concurrently (see _run_captured).
+_CAPTURE = threading.local()
+
+# Leading distribution name of a requirement line (drops extras, specifiers and markers).
+_REQ_RE = re.compile(r"^\s*([A-Za-z0-9_.\-]+)")
+
+# DIAG_QUIET=1 drops all output (e.g. in CI), before any formatting is done.
+_QUIET = os.environ.get("DIAG_QUIET") == "1"
+
+# Formatted timestamp, recomputed only when the wall-clock second changes.
+_TS_SEC = 0
+_TS_STR = ""
 
 def log(message):
-    """Logs message to console and file."""
-    print(message)
-    LOG_DIR.mkdir(exist_ok=True)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] {message}\n")
+    """Buffers message for the console and the log file."""
+    global _TS_SEC, _TS_STR
+    if _QUIET:
+        return
+    captured = getattr(_CAPTURE, "lines", None)
+    if captured is not None:
+        captured.append(message)
+        return
+    with _LOG_LOCK:
+        _STDOUT_BUF.append(message)
+        _STDOUT_BUF.append("\n")
+        s = int(time.time())
+        if s != _TS_SEC:
+            _TS_SEC = s
+            _TS_STR = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(s))
+        _BUF.append(f"[{_TS_STR}] {message}\n")
+
+def flush_log():
+    """Writes all buffered output to stdout and the log file, one write each."""
+    if _STDOUT_BUF:
+        sys.stdout.write("".join(_STDOUT_BUF))
+        sys.stdout.flush()
+        _STDOUT_BUF.clear()
+    if not _BUF:
+        return
+    # Binary mode skips the TextIOWrapper layer; the batch is encoded once.
+    with open(LOG_FILE, "ab", buffering=65536) as f:
+        f.write("".join(_BUF).encode("utf-8"))
+    _BUF.clear()
+
+# Make sure buffered lines still reach the file if diagnostics die early.
+atexit.register(flush_log)
+
+_DOTENV_LOADED = False
+
+def _ensure_dotenv():
+    """Loads .env once; later checks reuse the already-populated environment."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _DOTENV_LOADED = True
 
 def check_python_version():
     log("🔍 Checking Python version...")
@@ -25,36 +91,120 @@ def check_python_version():
     else:
         log(f"✅ Python {version.major}.{version.minor} OK.")
 
+_DEFAULT_REQUIRED_VARS = ("DISCORD_TOKEN",)
+
 def check_env_vars(required_vars=None):
     log("🔍 Checking environment variables...")
-    load_dotenv()
-    missing = []
-    for var in required_vars or ["DISCORD_TOKEN"]:
-        if not os.getenv(var):
-            missing.append(var)
+    _ensure_dotenv()
+    environ = os.environ
+    missing = [var for var in (required_vars or _DEFAULT_REQUIRED_VARS) if not environ.get(var)]
     if missing:
         log(f"⚠️ Missing environment variables: {', '.join(missing)}")
     else:
         log("✅ All required environment variables are set.")
 
-def check_requirements():
+def _try_import(pkg, deep=False):
+    """
+    Locates a package without executing it, returning (pkg, exception or None).
+    With deep=True the package is actually imported.
+    """
+    try:
+        if deep:
+            importlib.import_module(pkg)
+        elif importlib.util.find_spec(pkg) is None:
+            raise ModuleNotFoundError(f"No module named '{pkg}'")
+    except Exception as e:
+        return pkg, e
+    return pkg, None
+
+def _normalize_dist(name):
+    """PEP 503 normalization so 'Python_Dotenv' and 'python-dotenv' compare equal."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def _import_names():
+    """Maps installed distribution names to the top-level modules they provide."""
+    mapping = {}
+    for module, dists in importlib.metadata.packages_distributions().items():
+        for dist in dists:
+            mapping.setdefault(_normalize_dist(dist), []).append(module)
+    return mapping
+
+def _load_req_cache(key):
+    """Returns the cached requirement report lines for key, or None on a miss."""
+    try:
+        cache = json.loads(REQ_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cache.get("results") if cache.get("key") == key else None
+
+def _save_req_cache(key, lines):
+    try:
+        REQ_CACHE_FILE.write_text(json.dumps({"key": key, "results": lines}), encoding="utf-8")
+    except OSError as e:
+        log(f"⚠️ Could not write requirements cache: {e}")
+
+def check_requirements(deep=False):
     log("🔍 Checking dependencies from requirements.txt...")
-    if not Path("requirements.txt").exists():
+    req_path = Path("requirements.txt")
+    try:
+        mtime_ns = req_path.stat().st_mtime_ns
+    except FileNotFoundError:
         log("⚠️ No requirements.txt found.")
         return
 
-    with open("requirements.txt", "r") as f:
-        packages = [line.strip().split("==")[0] for line in f if line.strip()]
+    # Same requirements file, interpreter and check depth -> same answer.
+    key = [mtime_ns, *sys.version_info[:2], sys.prefix, deep]
+    cached = _load_req_cache(key)
+    if cached is not None:
+        for line in cached:
+            log(line)
+        log("ℹ️ Requirement results replayed from cache (delete logs/req_cache.json to recheck).")
+        return
 
-    for pkg in packages:
-        try:
-            importlib.import_module(pkg)
-        except ImportError:
-            log(f"❌ Missing package: {pkg}. Run `pip install {pkg}`.")
-        except Exception as e:
-            log(f"⚠️ Issue importing {pkg}: {e}")
+    packages = [
+        m.group(1)
+        for line in req_path.read_text(encoding="utf-8").splitlines()
+        if not line.lstrip().startswith("#") and (m := _REQ_RE.match(line))
+    ]
+    if not packages:
+        return
+
+    # Distribution names don't always match import names (Pillow -> PIL).
+    dist_modules = _import_names()
+    def check(pkg):
+        modules = dist_modules.get(_normalize_dist(pkg)) or [pkg.replace("-", "_")]
+        return pkg, _try_import(modules[0], deep)[1]
+
+    # Imports spend most of their time in file I/O, which releases the GIL,
+    # so overlapping them in threads cuts wall time. Results are logged in
+    # order from the main thread afterwards.
+    with ThreadPoolExecutor(max_workers=min(16, len(packages))) as ex:
+        results = list(ex.map(check, packages))
+
+    lines = []
+    for pkg, error in results:
+        if error is None:
+            lines.append(f"✅ {pkg} {'imported successfully' if deep else 'found'}.")
+        elif isinstance(error, ImportError):
+            lines.append(f"❌ Missing package: {pkg}. Run `pip install {pkg}`.")
         else:
-            log(f"✅ {pkg} imported successfully.")
+            lines.append(f"⚠️ Issue importing {pkg}: {error}")
+    for line in lines:
+        log(line)
+    _save_req_cache(key, lines)
+
+def _load_cog(name, cogs_dir="cogs"):
+    """
+    Executes a cog module straight from its file, skipping the finder search.
+    Returns (name, exception or None).
+    """
+    try:
+        spec = importlib.util.spec_from_file_location(f"cogs.{name}", os.path.join(cogs_dir, f"{name}.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        return name, e
+    return name, None
 
 def check_cogs():
     log("🔍 Checking cogs directory for broken modules...")
@@ -63,35 +213,83 @@ def check_cogs():
         log("⚠️ No 'cogs' directory found.")
         return
 
-    for file in cogs_dir.glob("*.py"):
-        name = file.stem
-        try:
-            importlib.import_module(f"cogs.{name}")
+    # Refresh __pycache__ first so the loads below read bytecode instead of
+    # compiling source; unchanged files are skipped by compileall's mtime check.
+    # Compile errors are reported by the load step below, so keep this quiet.
+    compileall.compile_dir(str(cogs_dir), maxlevels=0, quiet=2)
+
+    with os.scandir(cogs_dir) as it:
+        # Dunder/private and hidden files are never cogs, so don't try to load them.
+        names = [
+            e.name[:-3] for e in it
+            if e.name.endswith(".py") and not e.name.startswith(("_", "."))
+            and e.is_file(follow_symlinks=False)
+        ]
+    if not names:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as ex:
+        results = list(ex.map(_load_cog, names))
+
+    for name, error in results:
+        if error is None:
             log(f"✅ Cog '{name}' loaded successfully.")
-        except Exception as e:
-            log(f"❌ Cog '{name}' failed to load: {type(e).__name__} - {e}")
+        else:
+            log(f"❌ Cog '{name}' failed to load: {type(error).__name__} - {error}")
 
 def test_runtime():
     log("🔍 Running lightweight runtime probe...")
     try:
         if Path("bot.py").exists():
-            code = compile(Path("bot.py").read_text(), "bot.py", "exec")
-            exec(code, {"__name__": "__test__"})
+            # Compile only; executing bot.py would pull in its whole import graph.
+            py_compile.compile("bot.py", doraise=True)
             log("✅ Runtime probe passed (no immediate syntax issues).")
         else:
             log("⚠️ bot.py not found.")
+    except py_compile.PyCompileError as e:
+        log("❌ Syntax error detected:")
+        log(e.msg)
     except Exception as e:
         log("❌ Runtime error detected:")
-        log(traceback.format_exc())
+        # Format from the exception we already hold, capped so a deep chain stays readable.
+        tbe = traceback.TracebackException.from_exception(e, limit=20)
+        log("".join(tbe.format()))
+
+def _run_captured(check):
+    """Runs a check, collecting its log lines instead of emitting them."""
+    _CAPTURE.lines = []
+    try:
+        check()
+        return _CAPTURE.lines
+    finally:
+        del _CAPTURE.lines
 
 def main():
-    log("\n=== 🧠 Grazybot Diagnostics ===")
-    check_python_version()
-    check_env_vars()
-    check_requirements()
-    check_cogs()
-    test_runtime()
-    log("=== 🔧 Diagnostics Complete ===\n")
+    try:
+        log("\n=== 🧠 Grazybot Diagnostics ===")
+        _ensure_dotenv()
+        # Prime the path entry finders once up front so the concurrent
+        # requirement and cog lookups all hit a warm sys.path_importer_cache.
+        importlib.invalidate_caches()
+        importlib.machinery.PathFinder.find_spec("_grazybot_diagnose_warmup")
+        deep = "--deep" in sys.argv
+        checks = (
+            check_python_version,
+            check_env_vars,
+            lambda: check_requirements(deep=deep),
+            check_cogs,
+        )
+        # The checks are independent and I/O bound, so run them side by side
+        # and replay each one's output in order to keep the report readable.
+        with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+            futures = [ex.submit(_run_captured, check) for check in checks]
+            for future in futures:
+                for line in future.result():
+                    log(line)
+        test_runtime()
+        log("=== 🔧 Diagnostics Complete ===\n")
+    finally:
+        flush_log()
 
 if __name__ == "__main__":
     main()
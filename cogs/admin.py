@@ -66,20 +66,18 @@ class Admin(commands.Cog):
         """Adds or removes points from a user and logs the transaction."""
         await interaction.response.defer(ephemeral=True)
         
+        # Both paths upsert and return the new balance in a single statement
         if action == "add":
-            await clan.award_points(self.bot, member, amount, reason)
+            new_balance = await clan.award_points(self.bot, member, amount, reason)
+            if new_balance is None:
+                return await interaction.followup.send(f"An error occurred while updating points.", ephemeral=True)
         else: # remove
             try:
-                async with self.bot.db_pool.acquire() as conn:
-                    await conn.execute("INSERT INTO clan_points (discord_id, points) VALUES ($1, 0) ON CONFLICT (discord_id) DO NOTHING", member.id)
-                    await conn.execute("UPDATE clan_points SET points = GREATEST(0, points - $1) WHERE discord_id = $2", amount, member.id)
+                new_balance = await clan.remove_points(self.bot, member, amount)
                 logger.info(f"Admin {interaction.user} removed {amount} points from {member.display_name} for: {reason}")
             except Exception as e:
                 logger.error(f"Error removing points from {member.display_name}: {e}", exc_info=True)
                 return await interaction.followup.send(f"An error occurred while updating points.", ephemeral=True)
-
-        async with self.bot.db_pool.acquire() as conn:
-            new_balance = await conn.fetchval("SELECT points FROM clan_points WHERE discord_id = $1", member.id) or 0
         
         await interaction.followup.send(f"Successfully {action}ed {amount} points for {member.display_name}. Their new balance is {new_balance:,}.", ephemeral=True)
 
@@ -89,28 +87,33 @@ class Admin(commands.Cog):
         """Fetches SOTW winners from WOM and awards them points."""
         await interaction.response.defer(ephemeral=True)
         
-        comp_data, error = await wom.get_competition_details(competition_id)
+        comp_data, error = await wom.get_competition_details(self.bot, competition_id)
         if error:
             return await interaction.followup.send(f"Could not fetch WOM details for competition ID {competition_id}. Error: {error}", ephemeral=True)
 
         awarded_to = []
+        awards = []
         point_values = [100, 50, 25]
         
+        participants = comp_data.get('participations', [])
+        if not participants:
+            return await interaction.followup.send("No participants found in the competition data.", ephemeral=True)
+
+        # Look up all of the top 3's links in one query
+        names = [p['player']['displayName'] for p in participants[:3]]
         async with self.bot.db_pool.acquire() as conn:
-            participants = comp_data.get('participations', [])
-            if not participants:
-                return await interaction.followup.send("No participants found in the competition data.", ephemeral=True)
-
-            for i, participant in enumerate(participants[:3]):
-                osrs_name = participant['player']['displayName']
-                user_data = await conn.fetchrow("SELECT discord_id FROM user_links WHERE osrs_name = $1", osrs_name)
-
-                if user_data:
-                    member = interaction.guild.get_member(user_data['discord_id'])
-                    if member:
-                        reason = f"placing #{i+1} in the '{comp_data['title']}' SOTW"
-                        await clan.award_points(self.bot, member, point_values[i], reason)
-                        awarded_to.append(f"#{i+1}: {member.display_name} ({point_values[i]} points)")
+            links = await conn.fetch("SELECT osrs_name, discord_id FROM user_links WHERE osrs_name = ANY($1::text[])", names)
+        discord_ids = {r['osrs_name']: r['discord_id'] for r in links}
+
+        for i, osrs_name in enumerate(names):
+            discord_id = discord_ids.get(osrs_name)
+            member = interaction.guild.get_member(discord_id) if discord_id else None
+            if member:
+                reason = f"placing #{i+1} in the '{comp_data['title']}' SOTW"
+                awards.append((member, point_values[i], reason))
+                awarded_to.append(f"#{i+1}: {member.display_name} ({point_values[i]} points)")
+
+        await clan.award_points_bulk(self.bot, awards)
 
         if not awarded_to:
             return await interaction.followup.send("No winners could be found or linked for that competition.", ephemeral=True)
@@ -6,6 +6,7 @@
 
 import discord
 import json
+import os
 import random
 import logging
 from discord import app_commands
@@ -14,12 +15,34 @@ from datetime import datetime, timedelta, timezone
 
 from core.bot import GrazyBot
 from core import config
+from core.database import INSERT_BINGO_SUBMISSION
 from utils import bingo as bingo_utils, clan
-from utils.views import SubmissionView
+from utils.views import SubmissionView, BingoReviewButton
 
 logger = logging.getLogger(__name__)
 TASKS_FILE = "tasks.json" # Assumes this file exists at the project root
 
+# (mtime, tasks bucketed by difficulty) from the last read of TASKS_FILE.
+_tasks_cache: tuple[float, dict[str, list[dict]]] | None = None
+
+def load_tasks_by_difficulty() -> dict[str, list[dict]]:
+    """
+    Returns the bingo tasks grouped by difficulty, re-reading TASKS_FILE only when its mtime changes.
+    Raises FileNotFoundError or json.JSONDecodeError like a plain read would.
+    """
+    global _tasks_cache
+    mtime = os.stat(TASKS_FILE).st_mtime
+    if _tasks_cache is not None and _tasks_cache[0] == mtime:
+        return _tasks_cache[1]
+
+    with open(TASKS_FILE, 'r') as f:
+        all_tasks = json.load(f)
+    tasks_by_difficulty = {"common": [], "uncommon": [], "rare": []}
+    for task in all_tasks:
+        tasks_by_difficulty.setdefault(task.get('difficulty', 'common'), []).append(task)
+    _tasks_cache = (mtime, tasks_by_difficulty)
+    return tasks_by_difficulty
+
 class Bingo(commands.Cog):
     """Cog for all bingo-related commands."""
     
@@ -35,16 +58,11 @@ class Bingo(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         
         try:
-            with open(TASKS_FILE, 'r') as f:
-                all_tasks = json.load(f)
+            tasks_by_difficulty = load_tasks_by_difficulty()
         except (FileNotFoundError, json.JSONDecodeError):
             logger.error(f"'{TASKS_FILE}' not found or is invalid.")
             return await interaction.followup.send(f"Error: Could not load the bingo tasks file.", ephemeral=True)
         
-        tasks_by_difficulty = {"common": [], "uncommon": [], "rare": []}
-        for task in all_tasks:
-            tasks_by_difficulty.setdefault(task.get('difficulty', 'common'), []).append(task)
-        
         board_composition = {"common": 15, "uncommon": 7, "rare": 3}
         board_tasks = []
         for difficulty, count in board_composition.items():
@@ -55,7 +73,7 @@ class Bingo(commands.Cog):
         random.shuffle(board_tasks)
         board_tasks = board_tasks[:25]
         
-        image_path, error = await bingo_utils.generate_bingo_image(board_tasks)
+        image, error = await bingo_utils.generate_bingo_image(self.bot, board_tasks)
         if error:
             return await interaction.followup.send(f"Failed to generate bingo image: {error}", ephemeral=True)
 
@@ -67,21 +85,21 @@ class Bingo(commands.Cog):
         ai_embed_data = await clan.ai.generate_announcement_json("bingo_start")
         embed = discord.Embed.from_dict(ai_embed_data)
 
-        with open(image_path, 'rb') as f:
-            file = discord.File(f, filename="bingo_board.png")
-            embed.set_image(url="attachment://bingo_board.png")
-            embed.add_field(name="Event Ends", value=f"<t:{int(ends_at.timestamp())}:R>", inline=False)
-            embed.set_footer(text=f"Bingo started by {interaction.user.display_name}", icon_url=interaction.user.display_avatar.url)
-            message = await bingo_channel.send(embed=embed, file=file)
+        file = discord.File(image, filename="bingo_board.png")
+        embed.set_image(url="attachment://bingo_board.png")
+        embed.add_field(name="Event Ends", value=f"<t:{int(ends_at.timestamp())}:R>", inline=False)
+        embed.set_footer(text=f"Bingo started by {interaction.user.display_name}", icon_url=interaction.user.display_avatar.url)
+        message = await bingo_channel.send(embed=embed, file=file)
 
         async with self.bot.db_pool.acquire() as conn:
             await conn.execute("UPDATE bingo_events SET is_active = FALSE WHERE is_active = TRUE")
             await conn.execute(
                 "INSERT INTO bingo_events (ends_at, board_json, message_id) VALUES ($1, $2, $3)",
-                ends_at, json.dumps(board_tasks), message.id
+                ends_at, board_tasks, message.id
             )
+        bingo_utils.forget_boards()
         
-        await clan.send_global_announcement(self.bot, "bingo_start", {}, message.jump_url)
+        await clan.send_global_announcement(self.bot, "bingo_start", {}, message.jump_url, ai_embed_data)
         await interaction.followup.send(f"Bingo event created successfully in {bingo_channel.mention}!", ephemeral=True)
 
     @bingo_group.command(name="complete", description="Submit a task for bingo completion.")
@@ -90,18 +108,16 @@ class Bingo(commands.Cog):
                             proof: str):
         await interaction.response.defer(ephemeral=True)
         async with self.bot.db_pool.acquire() as conn:
-            event = await conn.fetchrow("SELECT id, board_json FROM bingo_events WHERE is_active = TRUE LIMIT 1")
+            event = await conn.fetchrow("SELECT id FROM bingo_events WHERE is_active = TRUE LIMIT 1")
             if not event:
                 return await interaction.followup.send("There is no active bingo event.", ephemeral=True)
             
-            task_names = [t['name'] for t in json.loads(event['board_json'])]
+            task_names = await bingo_utils.get_board_task_names(conn, event['id'])
             if task not in task_names:
                 return await interaction.followup.send("That task is not on the current bingo board.", ephemeral=True)
             
-            submission_id = await conn.fetchval(
-                "INSERT INTO bingo_submissions (event_id, user_id, task_name, proof_url) VALUES ($1, $2, $3, $4) RETURNING id",
-                event['id'], interaction.user.id, task, proof
-            )
+            stmt = await conn.statement(INSERT_BINGO_SUBMISSION)
+            submission_id = await stmt.fetchval(event['id'], interaction.user.id, task, proof)
 
         admin_embed = discord.Embed(title="New Bingo Submission", description=f"**Task:** {task}", color=discord.Color.yellow())
         admin_embed.set_author(name=interaction.user.display_name, icon_url=interaction.user.display_avatar.url)
@@ -110,7 +126,7 @@ class Bingo(commands.Cog):
         
         # This will post the review message in the channel the command was used.
         # Consider having a dedicated admin channel for this.
-        await interaction.channel.send(content="Admins, a new submission requires review:", embed=admin_embed, view=SubmissionView())
+        await interaction.channel.send(content="Admins, a new submission requires review:", embed=admin_embed, view=SubmissionView(submission_id))
         await interaction.followup.send("Your submission has been sent for review!", ephemeral=True)
 
     @bingo_group.command(name="board", description="View the current bingo board.")
@@ -133,4 +149,6 @@ class Bingo(commands.Cog):
             await interaction.followup.send("Bingo channel not found.", ephemeral=True)
 
 async def setup(bot: GrazyBot):
+    # Review buttons are matched by custom_id, so ones posted before a restart keep working.
+    bot.add_dynamic_items(BingoReviewButton)
     await bot.add_cog(Bingo(bot))
\ No newline at end of file
@@ -7,10 +7,10 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import asyncio
 import logging
 
 from core.bot import GrazyBot
+from core.database import SELECT_ACTIVE_EVENTS
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +29,8 @@ class Events(commands.Cog):
 
         try:
             async with self.bot.db_pool.acquire() as conn:
-                # Fetch all event data concurrently for efficiency
-                comp_task = conn.fetchrow("SELECT * FROM active_competitions WHERE ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
-                raf_task = conn.fetchrow("SELECT * FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
-                giveaway_task = conn.fetchrow("SELECT * FROM giveaways WHERE is_active = TRUE AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
-                pvm_event_task = conn.fetchrow("SELECT * FROM pvm_events WHERE is_active = TRUE AND starts_at > NOW() ORDER BY starts_at ASC LIMIT 1")
-
-                comp, raf, giveaway, pvm_event = await asyncio.gather(comp_task, raf_task, giveaway_task, pvm_event_task)
+                stmt = await conn.statement(SELECT_ACTIVE_EVENTS)
+                comp, raf, giveaway, pvm_event = await stmt.fetchrow()
 
             embed = discord.Embed(
                 title="🌟 Clan Event Status 🌟",
@@ -45,7 +40,7 @@ class Events(commands.Cog):
 
             # SOTW
             if comp:
-                embed.add_field(name="⚔️ Skill of the Week", value=f"**Competition:** [{comp['title']}](https://wiseoldman.net/competitions/{comp['id']})\n**Ends:** <t:{int(comp['ends_at'].timestamp())}:R>", inline=False)
+                embed.add_field(name="⚔️ Skill of the Week", value=f"**Competition:** [View on Wise Old Man](https://wiseoldman.net/competitions/{comp['competition_id']})\n**Ends:** <t:{int(comp['ends_at'].timestamp())}:R>", inline=False)
             else:
                 embed.add_field(name="⚔️ Skill of the Week", value="No SOTW competition is running.", inline=False)
             
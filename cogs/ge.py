@@ -8,25 +8,49 @@ import discord
 import aiohttp
 import re
 import logging
+from decimal import Decimal, InvalidOperation
 from discord import app_commands
 from discord.ext import commands
 
 from core.bot import GrazyBot
+from utils import ge as ge_utils
 from utils.time import format_timestamp
 
 logger = logging.getLogger(__name__)
 
+# "<quantity>[k|m] <item name>" entries separated by commas or the word "and".
+# The separator eats surrounding whitespace, so names come out already trimmed.
+ITEM_LIST_RE = re.compile(r"([\d.,]+[km]?)\s*([a-zA-Z\s'-]+?)\s*(?:,|\band\b|$)")
+# Thousands separators are dropped in one translate() pass.
+_DROP_COMMAS = str.maketrans("", "", ",")
+QUANTITY_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+POPULAR_ITEMS = ["twisted bow", "scythe of vitur", "abyssal whip", "dragon claws"]
+MAX_CHOICES = 25  # Discord's limit on autocomplete choices
+# Bounds on /ge value input so one oversized request can't hold up the event loop.
+MAX_ITEM_LIST_LENGTH = 2000
+MAX_ITEMS = 50
+
+def parse_quantity(quantity_str: str) -> int | None:
+    """
+    Parses a quantity like '1,000', '10k' or '2.1m' into an exact int, or None if it isn't one.
+    Decimal keeps fractional suffixed amounts exact where float would give e.g. 2,099,999.
+    """
+    quantity_str = quantity_str.translate(_DROP_COMMAS)
+    if quantity_str.isdigit():
+        return int(quantity_str)
+    multiplier = QUANTITY_SUFFIXES.get(quantity_str[-1:], 1)
+    if multiplier != 1:
+        quantity_str = quantity_str[:-1]
+    try:
+        return int(Decimal(quantity_str) * multiplier)
+    except InvalidOperation:
+        return None
+
 class GrandExchange(commands.Cog):
     """Cog for Grand Exchange commands."""
     
     def __init__(self, bot: GrazyBot):
         self.bot = bot
-        self.price_api_url = "https://prices.osrs.cloud/api/v1/latest"
-        self.session = aiohttp.ClientSession(headers={'User-Agent': 'GrazyBot/2.0'})
-
-    def cog_unload(self):
-        """Close the aiohttp session when the cog is unloaded."""
-        self.bot.loop.create_task(self.session.close())
 
     ge = app_commands.Group(name="ge", description="Commands for the Grand Exchange.")
 
@@ -36,17 +60,19 @@ class GrandExchange(commands.Cog):
         if not self.bot.item_mapping:
             return [app_commands.Choice(name="Item list is still loading, please wait...", value="...")]
         if not query:
-            return [app_commands.Choice(name=name.title(), value=name) for name in ["twisted bow", "scythe of vitur", "abyssal whip", "dragon claws"]]
+            return [app_commands.Choice(name=name.title(), value=name) for name in POPULAR_ITEMS]
         
-        matches = [name for name in self.bot.item_mapping.keys() if name.startswith(query)]
-        if len(matches) < 25:
-            containing_matches = [
-                name for name in self.bot.item_mapping.keys()
-                if query in name and name not in matches
-            ]
-            matches.extend(containing_matches)
+        # Prefix matches come from a bisect; only fall back to scanning for substrings when they run short.
+        matches = self.bot.item_mapping.starting_with(query, MAX_CHOICES)
+        if len(matches) < MAX_CHOICES:
+            seen = set(matches)
+            for name in self.bot.item_mapping.keys():
+                if query in name and name not in seen:
+                    matches.append(name)
+                    if len(matches) == MAX_CHOICES:
+                        break
             
-        return [app_commands.Choice(name=name.title(), value=name) for name in matches[:25]]
+        return [app_commands.Choice(name=name.title(), value=name) for name in matches]
 
     @ge.command(name="price", description="Check the Grand Exchange price of an item.")
     @app_commands.autocomplete(item=item_autocomplete)
@@ -54,31 +80,30 @@ class GrandExchange(commands.Cog):
         """Fetches and displays the GE price for a specified item."""
         await interaction.response.defer()
         
-        item_details = self.bot.item_mapping.get(item.lower())
+        item_details = self.bot.item_mapping.lookup(item)
         if not item_details:
             return await interaction.followup.send("Could not find this item. Please choose one from the list.", ephemeral=True)
             
         item_id = item_details['id']
         try:
-            async with self.session.get(f"{self.price_api_url}/item/{item_id}") as response:
-                response.raise_for_status()
-                price_data = await response.json()
-
-                embed = discord.Embed(title=f"Price Check: {item_details['name']}", color=discord.Color.gold())
-                if item_details.get('icon'):
-                    embed.set_thumbnail(url=item_details['icon'])
-                    
-                buy_price = price_data.get('high', 0)
-                sell_price = price_data.get('low', 0)
-                embed.add_field(name="Buy Price", value=f"{buy_price:,} gp", inline=True)
-                embed.add_field(name="Sell Price", value=f"{sell_price:,} gp", inline=True)
-                embed.add_field(name="Margin", value=f"{buy_price - sell_price:,} gp", inline=True)
-
-                embed.add_field(name="Last Buy", value=f"Updated {format_timestamp(price_data.get('highTime'))}", inline=True)
-                embed.add_field(name="Last Sell", value=f"Updated {format_timestamp(price_data.get('lowTime'))}", inline=True)
-
-                embed.set_footer(text="Price data from osrs.cloud")
-                await interaction.followup.send(embed=embed)
+            prices = await ge_utils.get_latest_prices(self.bot)
+            price_data = prices.get(str(item_id), {})
+
+            embed = discord.Embed(title=f"Price Check: {item_details['name']}", color=discord.Color.gold())
+            if item_details.get('icon'):
+                embed.set_thumbnail(url=item_details['icon'])
+                
+            buy_price = price_data.get('high') or 0
+            sell_price = price_data.get('low') or 0
+            embed.add_field(name="Buy Price", value=f"{buy_price:,} gp", inline=True)
+            embed.add_field(name="Sell Price", value=f"{sell_price:,} gp", inline=True)
+            embed.add_field(name="Margin", value=f"{buy_price - sell_price:,} gp", inline=True)
+
+            embed.add_field(name="Last Buy", value=f"Updated {format_timestamp(price_data.get('highTime'))}", inline=True)
+            embed.add_field(name="Last Sell", value=f"Updated {format_timestamp(price_data.get('lowTime'))}", inline=True)
+
+            embed.set_footer(text="Price data from osrs.cloud")
+            await interaction.followup.send(embed=embed)
         except aiohttp.ClientError as e:
             logger.error(f"GE price check failed for item '{item}' (ID: {item_id}): {e}")
             await interaction.followup.send(f"Error fetching price data. The API might be down.", ephemeral=True)
@@ -95,52 +120,47 @@ class GrandExchange(commands.Cog):
         valued_items = []
         unmatched_items = []
         
-        item_regex = re.compile(r"([\d.,]+[km]?)\s*([a-zA-Z\s'-]+?)(?:,|$|and)")
-        matches = item_regex.findall(item_list.lower())
+        if len(item_list) > MAX_ITEM_LIST_LENGTH:
+            return await interaction.followup.send(f"That list is too long. Please keep it under {MAX_ITEM_LIST_LENGTH} characters.", ephemeral=True)
+
+        matches = ITEM_LIST_RE.findall(item_list.lower())
 
+        if len(matches) > MAX_ITEMS:
+            return await interaction.followup.send(f"Please value at most {MAX_ITEMS} items at a time.", ephemeral=True)
         if not matches:
             return await interaction.followup.send("Invalid format. Please use a format like '10k raw sharks, 1 twisted bow'.", ephemeral=True)
 
-        for quantity_str, item_name_raw in matches:
-            item_name = item_name_raw.strip()
-            quantity_str = quantity_str.strip().replace(',', '')
-
-            try:
-                if 'k' in quantity_str:
-                    quantity = float(quantity_str.replace('k', '')) * 1_000
-                elif 'm' in quantity_str:
-                    quantity = float(quantity_str.replace('m', '')) * 1_000_000
-                else:
-                    quantity = float(quantity_str)
-            except ValueError:
+        # One bulk request prices every item in the list
+        try:
+            prices = await ge_utils.get_latest_prices(self.bot)
+        except aiohttp.ClientError as e:
+            logger.error(f"GE value check failed to fetch prices: {e}")
+            return await interaction.followup.send("Error fetching price data. The API might be down.", ephemeral=True)
+
+        for quantity_str, item_name in matches:
+            quantity = parse_quantity(quantity_str)
+            if quantity is None:
                 unmatched_items.append(f"'{quantity_str} {item_name}' (Invalid quantity)")
                 continue
 
-            matched_item = self.bot.item_mapping.get(item_name)
-            if not matched_item:
-                # Try to find a partial match as a fallback
-                for key, val in self.bot.item_mapping.items():
-                    if item_name in key:
-                        matched_item = val
-                        break
+            matched_item = self.bot.item_mapping.search(item_name)
 
             if matched_item:
-                try:
-                    async with self.session.get(f"{self.price_api_url}/item/{matched_item['id']}") as resp:
-                        resp.raise_for_status()
-                        price = (await resp.json()).get('high', 0)
-                        value = price * quantity
-                        total_value += value
-                        valued_items.append(f"`{int(quantity):,}` x **{matched_item['name']}** @ `{price:,}` = `{int(value):,}` gp")
-                except aiohttp.ClientError:
-                    unmatched_items.append(f"**{matched_item['name']}** (Price fetch error)")
+                price_data = prices.get(str(matched_item['id']))
+                if price_data is None:
+                    unmatched_items.append(f"**{matched_item['name']}** (No price data)")
+                    continue
+                price = price_data.get('high') or 0
+                value = price * quantity
+                total_value += value
+                valued_items.append(f"`{quantity:,}` x **{matched_item['name']}** @ `{price:,}` = `{value:,}` gp")
             else:
                 unmatched_items.append(f"**{item_name.title()}** (Item not found)")
 
         embed = discord.Embed(title="GE Value Calculator", color=discord.Color.dark_teal())
         if valued_items:
             embed.description = "\n".join(valued_items)
-            embed.add_field(name="Total Value", value=f"**{int(total_value):,} gp**", inline=False)
+            embed.add_field(name="Total Value", value=f"**{total_value:,} gp**", inline=False)
         if unmatched_items:
             embed.add_field(name="Unmatched / Failed Items", value="\n".join(unmatched_items), inline=False)
 
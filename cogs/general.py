@@ -10,6 +10,7 @@ from discord import app_commands
 import logging
 
 from core.bot import GrazyBot
+from core.database import SELECT_POINTS
 
 logger = logging.getLogger(__name__)
 
@@ -69,9 +70,8 @@ class General(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             async with self.bot.db_pool.acquire() as conn:
-                point_data = await conn.fetchval(
-                    "SELECT points FROM clan_points WHERE discord_id = $1", interaction.user.id
-                )
+                stmt = await conn.statement(SELECT_POINTS)
+                point_data = await stmt.fetchval(interaction.user.id)
 
             current_points = point_data if point_data is not None else 0
             await interaction.followup.send(f"You currently have **{current_points:,}** Clan Points.")
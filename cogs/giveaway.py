@@ -17,6 +17,18 @@ from utils.views import GiveawayView
 
 logger = logging.getLogger(__name__)
 
+ENTRIES_SHOWN = 50
+
+# The giveaway, its entry count and the first $2 entrants in one round trip.
+GIVEAWAY_ENTRIES_SQL = """
+    SELECT g.prize, COUNT(e.user_id) AS total,
+           (ARRAY_AGG(e.user_id ORDER BY e.id) FILTER (WHERE e.user_id IS NOT NULL))[1:$2] AS shown
+    FROM giveaways g
+    LEFT JOIN giveaway_entries e ON e.giveaway_id = g.id
+    WHERE g.message_id = $1
+    GROUP BY g.id
+"""
+
 class Giveaway(commands.Cog):
     """Cog for managing giveaways with buttons."""
     
@@ -65,6 +77,7 @@ class Giveaway(commands.Cog):
                     "INSERT INTO giveaways (message_id, channel_id, prize, ends_at, winner_count, role_id) VALUES ($1, $2, $3, $4, $5, $6)",
                     giveaway_message.id, giveaway_channel.id, prize, ends_at, winners, reward_role.id if reward_role else None
                 )
+            self.bot.schedule_event_check(ends_at)
             await interaction.followup.send(f"Giveaway for **{prize}** has been started in {giveaway_channel.mention}!", ephemeral=True)
             logger.info(f"Giveaway started by {interaction.user}: {prize}")
         except Exception as e:
@@ -83,24 +96,22 @@ class Giveaway(commands.Cog):
 
         try:
             async with self.bot.db_pool.acquire() as conn:
-                giveaway_data = await conn.fetchrow("SELECT * FROM giveaways WHERE message_id = $1", msg_id)
-                if not giveaway_data:
-                    return await interaction.followup.send("No giveaway found with that message ID.", ephemeral=True)
+                giveaway_data = await conn.fetchrow(GIVEAWAY_ENTRIES_SQL, msg_id, ENTRIES_SHOWN)
+            if not giveaway_data:
+                return await interaction.followup.send("No giveaway found with that message ID.", ephemeral=True)
 
-                entries = await conn.fetch("SELECT user_id FROM giveaway_entries WHERE message_id = $1", msg_id)
-            
-            embed = discord.Embed(title=f"Entries for '{giveaway_data['prize']}'", description=f"Total Entries: **{len(entries)}**", color=discord.Color.blue())
+            total = giveaway_data['total']
+            embed = discord.Embed(title=f"Entries for '{giveaway_data['prize']}'", description=f"Total Entries: **{total}**", color=discord.Color.blue())
             
-            if entries:
+            if total:
                 entrant_list = []
-                for entry in entries:
-                    member = interaction.guild.get_member(entry['user_id'])
-                    entrant_list.append(member.mention if member else f"User ID: {entry['user_id']}")
-
-                # Paginate if the list is too long
-                if len(entrant_list) > 50:
-                     embed.description += "\n\nShowing first 50 entries."
-                     entrant_list = entrant_list[:50]
+                for user_id in giveaway_data['shown']:
+                    member = interaction.guild.get_member(user_id)
+                    entrant_list.append(member.mention if member else f"User ID: {user_id}")
+
+                # Only the first ENTRIES_SHOWN entrants are fetched
+                if total > ENTRIES_SHOWN:
+                     embed.description += f"\n\nShowing first {ENTRIES_SHOWN} entries."
 
                 embed.description += "\n\n" + "\n".join(f"• {e}" for e in entrant_list)
 
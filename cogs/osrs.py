@@ -17,16 +17,14 @@ from utils import osrs as osrs_utils, ai
 
 logger = logging.getLogger(__name__)
 
+OSRS_NAME_RE = re.compile(r"^[a-zA-Z0-9 _-]{1,12}$")
+
 class OSRS(commands.Cog):
     """Cog for OSRS-related commands like stats, kc, and linking accounts."""
     
     def __init__(self, bot: GrazyBot):
         self.bot = bot
         self.hiscores_url = "https://secure.runescape.com/m=hiscore_oldschool/index_lite.ws"
-        self.session = aiohttp.ClientSession(headers={'User-Agent': 'GrazyBot/2.0'})
-
-    def cog_unload(self):
-        self.bot.loop.create_task(self.session.close())
 
     osrs_group = app_commands.Group(name="osrs", description="Commands for Old School RuneScape integration.")
 
@@ -35,7 +33,7 @@ class OSRS(commands.Cog):
         """Links a user's Discord ID to their OSRS username."""
         await interaction.response.defer(ephemeral=True)
         
-        if not re.match(r"^[a-zA-Z0-9 _-]{1,12}$", osrs_name):
+        if not OSRS_NAME_RE.match(osrs_name):
             return await interaction.followup.send("Invalid OSRS username format.", ephemeral=True)
 
         try:
@@ -64,7 +62,7 @@ class OSRS(commands.Cog):
             return await interaction.followup.send(f"{'You have' if target_member == interaction.user else f'{target_member.display_name} has'} not linked an OSRS name yet. Use `/osrs link`.", ephemeral=True)
 
         try:
-            async with self.session.get(f"{self.hiscores_url}?player={up.quote(osrs_name)}") as response:
+            async with self.bot.http_session.get(f"{self.hiscores_url}?player={up.quote(osrs_name)}") as response:
                 if response.status == 404:
                     return await interaction.followup.send(f"OSRS name **{osrs_name}** not found on the Hiscores.", ephemeral=True)
                 response.raise_for_status()
@@ -92,12 +90,10 @@ class OSRS(commands.Cog):
             overall = skills_data['overall']
             embed.add_field(name="Overall", value=f"Rank: `{overall['rank']:,}`\nLevel: `{overall['level']}`\nXP: `{overall['xp']:,}`", inline=False)
         
-        combat_skills = ["attack", "strength", "defence", "ranged", "prayer", "magic", "hitpoints"]
-        for i, block in enumerate(osrs_utils.format_skill_list(combat_skills, skills_data)):
+        for i, block in enumerate(osrs_utils.format_skill_list(osrs_utils.COMBAT_SKILLS, skills_data)):
             embed.add_field(name="Combat Skills", value=block, inline=True)
             
-        skilling_skills = [s for s in osrs_utils.WOM_SKILLS if s not in combat_skills and s != 'overall']
-        for i, block in enumerate(osrs_utils.format_skill_list(skilling_skills, skills_data)):
+        for i, block in enumerate(osrs_utils.format_skill_list(osrs_utils.SKILLING_SKILLS, skills_data)):
             embed.add_field(name="Skilling", value=block, inline=True)
             
         await interaction.followup.send(embed=embed)
@@ -115,7 +111,7 @@ class OSRS(commands.Cog):
             return await interaction.followup.send(f"{'You have' if target_member == interaction.user else f'{target_member.display_name} has'} not linked an OSRS name yet. Use `/osrs link`.", ephemeral=True)
 
         try:
-            async with self.session.get(f"{self.hiscores_url}?player={up.quote(osrs_name)}") as response:
+            async with self.bot.http_session.get(f"{self.hiscores_url}?player={up.quote(osrs_name)}") as response:
                 if response.status == 404:
                     return await interaction.followup.send(f"OSRS name **{osrs_name}** not found on the Hiscores.", ephemeral=True)
                 response.raise_for_status()
@@ -131,22 +127,10 @@ class OSRS(commands.Cog):
         if not activities_data:
             embed.description = "No notable boss kill counts found on the Hiscores."
         else:
-            kc_text = []
-            for name, data in activities_data.items():
-                kc_text.append(f"**{name.replace('_', ' ').title()}**: `{data['score']:,}`")
-
+            kc_lines = (f"**{osrs_utils.ACTIVITY_DISPLAY[name]}**: `{data['score']:,}`\n" for name, data in activities_data.items())
             # Paginate if needed
-            current_field = ""
-            field_count = 1
-            for line in kc_text:
-                if len(current_field) + len(line) + 1 > 1024:
-                    embed.add_field(name=f"PvM Kills (Part {field_count})", value=current_field, inline=False)
-                    current_field = line + "\n"
-                    field_count += 1
-                else:
-                    current_field += line + "\n"
-            if current_field:
-                embed.add_field(name=f"PvM Kills (Part {field_count})", value=current_field, inline=False)
+            for i, block in enumerate(osrs_utils.chunk_lines(kc_lines), start=1):
+                embed.add_field(name=f"PvM Kills (Part {i})", value=block, inline=False)
         
         await interaction.followup.send(embed=embed)
 
@@ -11,6 +11,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from core.bot import GrazyBot
+from core.database import SELECT_ACTIVE_REWARD, SELECT_POINTS
 
 logger = logging.getLogger(__name__)
 
@@ -61,11 +62,13 @@ class PointStore(commands.Cog):
         await interaction.response.defer(ephemeral=True)
         try:
             async with self.bot.db_pool.acquire() as conn, conn.transaction():
-                reward = await conn.fetchrow("SELECT * FROM rewards WHERE reward_name ILIKE $1 AND is_active = TRUE", reward_name)
+                stmt = await conn.statement(SELECT_ACTIVE_REWARD)
+                reward = await stmt.fetchrow(reward_name)
                 if not reward:
                     return await interaction.followup.send(f"Reward '{reward_name}' not found or is currently inactive.", ephemeral=True)
 
-                user_points = await conn.fetchval("SELECT points FROM clan_points WHERE discord_id = $1", interaction.user.id) or 0
+                stmt = await conn.statement(SELECT_POINTS)
+                user_points = await stmt.fetchval(interaction.user.id) or 0
                 if user_points < reward['point_cost']:
                     return await interaction.followup.send(f"You need {reward['point_cost']:,} points, but you only have {user_points:,}.", ephemeral=True)
 
@@ -78,14 +81,14 @@ class PointStore(commands.Cog):
                 )
 
                 # Handle role rewards
-                role_reward = await conn.fetchrow("SELECT role_id FROM role_rewards WHERE reward_id = $1", reward['id'])
-                if role_reward and role_reward['role_id']:
-                    role = interaction.guild.get_role(role_reward['role_id'])
+                # The reward's role came back with it from the LEFT JOIN
+                if reward['role_id']:
+                    role = interaction.guild.get_role(reward['role_id'])
                     if role:
                         await interaction.user.add_roles(role, reason=f"Redeemed '{reward['reward_name']}' from point store.")
                         await interaction.followup.send(f"You redeemed **{reward['reward_name']}**! The role **{role.name}** has been added. Your new balance is `{new_balance:,}`.", ephemeral=True)
                     else:
-                        await interaction.followup.send(f"Redemption successful, but the associated role (ID: {role_reward['role_id']}) was not found.", ephemeral=True)
+                        await interaction.followup.send(f"Redemption successful, but the associated role (ID: {reward['role_id']}) was not found.", ephemeral=True)
                 else:
                     await interaction.followup.send(f"You redeemed **{reward['reward_name']}**! Your new balance is `{new_balance:,}`. Please contact an admin for fulfillment.", ephemeral=True)
 
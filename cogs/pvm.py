@@ -47,10 +47,11 @@ class PVM(commands.Cog):
         if not pvm_channel:
             return await interaction.followup.send("PVM Event Channel ID not configured.", ephemeral=True)
         
-        details = {'title': title, 'description': description, 'start_time_unix': int(event_start_dt.timestamp())}
+        start_ts = int(event_start_dt.timestamp())
+        details = {'title': title, 'description': description, 'start_time_unix': start_ts}
         ai_embed_data = await ai.generate_announcement_json("pvm_event_start", details)
         event_embed = discord.Embed.from_dict(ai_embed_data)
-        event_embed.add_field(name="⏰ Starts At", value=f"<t:{int(event_start_dt.timestamp())}:F>", inline=False)
+        event_embed.add_field(name="⏰ Starts At", value=f"<t:{start_ts}:F>", inline=False)
         event_embed.add_field(name="⏳ Duration", value=f"{duration_minutes} minutes", inline=False)
         event_embed.set_footer(text=f"Event by {interaction.user.display_name}", icon_url=interaction.user.display_avatar.url)
 
@@ -68,7 +69,7 @@ class PVM(commands.Cog):
 
             await event_message.edit(view=PvmEventView(event_id=event_id))
             await interaction.followup.send(f"PVM event '{title}' scheduled in {pvm_channel.mention}!", ephemeral=True)
-            await clan.send_global_announcement(self.bot, "pvm_event_start", details, event_message.jump_url)
+            await clan.send_global_announcement(self.bot, "pvm_event_start", details, event_message.jump_url, ai_embed_data)
             logger.info(f"PVM event '{title}' scheduled by {interaction.user}.")
         except Exception as e:
             logger.error(f"Failed to schedule PVM event '{title}': {e}", exc_info=True)
@@ -121,6 +122,7 @@ class PVM(commands.Cog):
                 )
                 if not event_data:
                     return await interaction.followup.send(f"PVM event with ID `{event_id}` not found or already inactive.", ephemeral=True)
+            self.bot.pvm_signups.pop(event_id, None)
             
             event_channel = self.bot.get_channel(event_data['channel_id'])
             if event_channel:
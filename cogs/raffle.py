@@ -4,6 +4,7 @@
 # cogs/raffle.py
 # Contains commands for managing raffles.
 
+import asyncio
 import discord
 import logging
 from discord import app_commands, Color
@@ -12,10 +13,14 @@ from datetime import datetime, timedelta, timezone
 
 from core.bot import GrazyBot
 from core import config
+from core.database import ENTER_RAFFLE, GIVE_RAFFLE_TICKETS, SELECT_OPEN_RAFFLE, SELECT_RAFFLE_TICKETS
 from utils import raffle as raffle_utils, clan, ai
 
 logger = logging.getLogger(__name__)
 
+MAX_SELF_TICKETS = 10  # Tickets a member can claim themselves per raffle
+QUERY_MEMBERS_LIMIT = 100  # Discord's cap on user_ids per member request
+
 class Raffle(commands.Cog):
     """Cog for all raffle-related commands."""
 
@@ -53,11 +58,12 @@ class Raffle(commands.Cog):
                     "INSERT INTO raffles (prize, ends_at, message_id, channel_id) VALUES ($1, $2, $3, $4) RETURNING id",
                     prize, ends_at, raffle_message.id, raffle_channel.id
                 )
+            self.bot.schedule_event_check(ends_at)
 
             embed.set_footer(text=f"Raffle ID: {raffle_id} | Started by {interaction.user.display_name}", icon_url=interaction.user.display_avatar.url)
             await raffle_message.edit(embed=embed)
 
-            await clan.send_global_announcement(self.bot, "raffle_start", details, raffle_message.jump_url)
+            await clan.send_global_announcement(self.bot, "raffle_start", details, raffle_message.jump_url, ai_embed_data)
             await interaction.followup.send(f"Raffle (ID: {raffle_id}) for **{prize}** created in {raffle_channel.mention}!", ephemeral=True)
             logger.info(f"Raffle {raffle_id} for '{prize}' started by {interaction.user}.")
         except Exception as e:
@@ -69,21 +75,18 @@ class Raffle(commands.Cog):
         """Allows a user to claim up to 10 tickets for the active raffle."""
         await interaction.response.defer(ephemeral=True)
         try:
+            # One round trip finds the raffle, checks the cap, inserts and counts
             async with self.bot.db_pool.acquire() as conn:
-                active_raffle = await conn.fetchrow("SELECT id, prize FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
-                if not active_raffle:
-                    return await interaction.followup.send("There is no active raffle to enter.", ephemeral=True)
-
-                raffle_id, prize = active_raffle['id'], active_raffle['prize']
-
-                self_entries = await conn.fetchval("SELECT COUNT(*) FROM raffle_entries WHERE user_id = $1 AND raffle_id = $2 AND source = 'self'", interaction.user.id, raffle_id)
-                if self_entries >= 10:
-                    return await interaction.followup.send(f"You have already claimed your max of 10 tickets for the '{prize}' raffle.", ephemeral=True)
-
-                await conn.execute("INSERT INTO raffle_entries (raffle_id, user_id, source) VALUES ($1, $2, 'self')", raffle_id, interaction.user.id)
-                total_tickets = await conn.fetchval("SELECT COUNT(*) FROM raffle_entries WHERE user_id = $1 AND raffle_id = $2", interaction.user.id, raffle_id)
+                stmt = await conn.statement(ENTER_RAFFLE)
+                result = await stmt.fetchrow(interaction.user.id, MAX_SELF_TICKETS)
+            if not result:
+                return await interaction.followup.send("There is no active raffle to enter.", ephemeral=True)
+
+            prize = result['prize']
+            if not result['entered']:
+                return await interaction.followup.send(f"You have already claimed your max of {MAX_SELF_TICKETS} tickets for the '{prize}' raffle.", ephemeral=True)
             
-            await interaction.followup.send(f"You have entered the **{prize}** raffle! You now have {total_tickets} ticket(s).", ephemeral=True)
+            await interaction.followup.send(f"You have entered the **{prize}** raffle! You now have {result['total_tickets']} ticket(s).", ephemeral=True)
         except Exception as e:
             logger.error(f"Error entering raffle for {interaction.user}: {e}", exc_info=True)
             await interaction.followup.send("An error occurred while entering the raffle.", ephemeral=True)
@@ -94,17 +97,16 @@ class Raffle(commands.Cog):
                            amount: int):
         """Gives a specified number of raffle tickets to a member."""
         await interaction.response.defer(ephemeral=True)
+        if amount < 1:
+            return await interaction.followup.send("The amount of tickets must be at least 1.", ephemeral=True)
+        # Postgres finds the raffle and adds to the member's ticket count, returning the new total in one round trip.
         async with self.bot.db_pool.acquire() as conn:
-            active_raffle = await conn.fetchrow("SELECT id FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
-            if not active_raffle:
-                return await interaction.followup.send("There is no active raffle.", ephemeral=True)
-            
-            raffle_id = active_raffle['id']
-            entries = [(raffle_id, member.id, 'admin') for _ in range(amount)]
-            await conn.copy_records_to_table('raffle_entries', records=entries, columns=['raffle_id', 'user_id', 'source'])
-            
-            total_tickets = await conn.fetchval("SELECT COUNT(*) FROM raffle_entries WHERE user_id = $1 AND raffle_id = $2", member.id, raffle_id)
-            
+            stmt = await conn.statement(GIVE_RAFFLE_TICKETS)
+            result = await stmt.fetchrow(member.id, amount)
+        if not result:
+            return await interaction.followup.send("There is no active raffle.", ephemeral=True)
+        total_tickets = result['total_tickets']
+
         await interaction.followup.send(f"Gave {amount} ticket(s) to {member.display_name}. They now have {total_tickets} ticket(s).", ephemeral=True)
         logger.info(f"Admin {interaction.user} gave {amount} raffle tickets to {member.display_name}.")
 
@@ -113,20 +115,31 @@ class Raffle(commands.Cog):
         """Displays a list of all participants and their ticket counts for the current raffle."""
         await interaction.response.defer()
         async with self.bot.db_pool.acquire() as conn:
-            active_raffle = await conn.fetchrow("SELECT id, prize FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1")
+            stmt = await conn.statement(SELECT_OPEN_RAFFLE)
+            active_raffle = await stmt.fetchrow()
             if not active_raffle:
                 return await interaction.followup.send("There is no active raffle.", ephemeral=True)
             
             raffle_id, prize = active_raffle['id'], active_raffle['prize']
-            entries = await conn.fetch("SELECT user_id, COUNT(user_id) as count FROM raffle_entries WHERE raffle_id = $1 GROUP BY user_id ORDER BY count DESC", raffle_id)
+            stmt = await conn.statement(SELECT_RAFFLE_TICKETS)
+            entries = await stmt.fetch(raffle_id)
 
         embed = discord.Embed(title=f"🎟️ Raffle Tickets for '{prize}'", color=Color.gold())
         if not entries:
             embed.description = "No tickets have been claimed yet."
         else:
+            # Members come from the cache; any it's missing are asked for in one gateway request.
+            members = {entry['user_id']: interaction.guild.get_member(entry['user_id']) for entry in entries}
+            missing = [user_id for user_id, member in members.items() if member is None][:QUERY_MEMBERS_LIMIT]
+            if missing:
+                try:
+                    fetched = await interaction.guild.query_members(user_ids=missing, limit=len(missing), cache=True)
+                    members.update((member.id, member) for member in fetched)
+                except asyncio.TimeoutError:
+                    logger.warning(f"Timed out looking up {len(missing)} raffle entrants in {interaction.guild.id}.")
             desc = []
             for entry in entries:
-                member = interaction.guild.get_member(entry['user_id'])
+                member = members[entry['user_id']]
                 desc.append(f"**{member.display_name if member else f'ID: {entry['user_id']}'}**: `{entry['count']}` ticket(s)")
             embed.description = "\n".join(desc)
             
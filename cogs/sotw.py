@@ -14,17 +14,14 @@ from datetime import datetime
 from core.bot import GrazyBot
 from core import config
 from utils import wom, clan
+from utils.osrs import POLLABLE_SKILLS, skill_display
 from utils.views import SotwPollView # This will be created in utils/views.py
 
 logger = logging.getLogger(__name__)
 
-# This should be in a config file, but for now, it's here.
-WOM_SKILLS = [
-    "overall", "attack", "defence", "strength", "hitpoints", "ranged", "prayer",
-    "magic", "cooking", "woodcutting", "fletching", "fishing", "firemaking",
-    "crafting", "smithing", "mining", "herblore", "agility", "thieving",
-    "slayer", "farming", "runecrafting", "hunter", "construction"
-]
+RANK_EMOJIS = ("🥇", "🥈", "🥉")
+# Stand-in for participants WOM returns without progress data.
+_NO_PROGRESS = {'gained': 0}
 
 class SOTW(commands.Cog):
     """Cog for SOTW commands."""
@@ -36,30 +33,34 @@ class SOTW(commands.Cog):
 
     async def start_sotw_logic(self, interaction: discord.Interaction, skill: str, duration_days: int):
         """Shared logic for starting an SOTW, usable by commands and views."""
-        data, error = await wom.create_competition(skill, duration_days)
+        start_date, end_date = wom.competition_window(duration_days)
+        data, error = await wom.create_competition(self.bot, skill, start_date, end_date)
         if error:
             await interaction.followup.send(f"Error creating WOM competition: {error}", ephemeral=True)
             return
 
-        competition_id = data.get('competition', {}).get('id')
+        competition = data.get('competition', {})
+        competition_id = competition.get('id')
         if not competition_id:
             return await interaction.followup.send("Failed to get competition ID from WOM.", ephemeral=True)
 
         # Store the active competition in the database
         async with self.bot.db_pool.acquire() as conn:
             await conn.execute(
-                "INSERT INTO active_competitions (id, ends_at) VALUES ($1, $2)",
-                competition_id, data['endsAt']
+                "INSERT INTO active_competitions (competition_id, ends_at) VALUES ($1, $2)",
+                competition_id, end_date
             )
+        self.bot.schedule_event_check(end_date)
+        self.bot.current_sotw = (competition_id, end_date)
 
         sotw_channel = self.bot.get_channel(config.SOTW_CHANNEL_ID)
         if sotw_channel:
-            embed = self.create_competition_embed(data, interaction.user)
+            embed = self.create_competition_embed(competition, interaction.user, end_date)
             sotw_message = await sotw_channel.send(embed=embed)
             await clan.send_global_announcement(
-                self.bot, "sotw_start", {"skill": skill.capitalize()}, sotw_message.jump_url
+                self.bot, "sotw_start", {"skill": skill_display(skill)}, sotw_message.jump_url
             )
-            await interaction.followup.send(f"SOTW for **{skill.capitalize()}** started in {sotw_channel.mention}!", ephemeral=True)
+            await interaction.followup.send(f"SOTW for **{skill_display(skill)}** started in {sotw_channel.mention}!", ephemeral=True)
         else:
             logger.warning("SOTW_CHANNEL_ID not configured.")
             await interaction.followup.send("SOTW Channel not configured. Please set it up.", ephemeral=True)
@@ -78,7 +79,7 @@ class SOTW(commands.Cog):
         if interaction.guild.id in self.bot.active_polls:
             return await interaction.response.send_message("An SOTW poll is already active in this server.", ephemeral=True)
         
-        poll_skills = random.sample([s for s in WOM_SKILLS if s != 'overall'], 6)
+        poll_skills = random.sample(POLLABLE_SKILLS, 6)
         
         async def start_sotw_callback(interaction, winner):
             await self.start_sotw_logic(interaction, winner, 7)
@@ -92,6 +93,7 @@ class SOTW(commands.Cog):
 
         sotw_channel = self.bot.get_channel(config.SOTW_CHANNEL_ID)
         if sotw_channel:
+            await view.prepare()
             poll_message = await sotw_channel.send(embed=await view.create_embed(), view=view)
             self.bot.active_polls[interaction.guild.id] = poll_message.id
             await interaction.response.send_message(f"SOTW Poll created in {sotw_channel.mention}!", ephemeral=True)
@@ -104,20 +106,23 @@ class SOTW(commands.Cog):
         await interaction.response.defer()
         
         if not competition_id:
-            async with self.bot.db_pool.acquire() as conn:
-                comp_id = await conn.fetchval("SELECT id FROM active_competitions ORDER BY ends_at DESC LIMIT 1")
-                if not comp_id:
+            current = self.bot.current_sotw
+            if current is None or current[1] <= discord.utils.utcnow():
+                async with self.bot.db_pool.acquire() as conn:
+                    current = await conn.fetchrow("SELECT competition_id, ends_at FROM active_competitions ORDER BY ends_at DESC LIMIT 1")
+                if not current:
                     return await interaction.followup.send("No active SOTW competition found.", ephemeral=True)
-                competition_id = comp_id
+                self.bot.current_sotw = tuple(current)
+            competition_id = current[0]
         
-        data, error = await wom.get_competition_details(competition_id)
+        data, error = await wom.get_competition_details(self.bot, competition_id)
         if error:
             return await interaction.followup.send(f"Could not fetch details for competition ID {competition_id}. Error: {error}")
 
         embed = self.create_leaderboard_embed(data)
         await interaction.followup.send(embed=embed)
 
-    def create_competition_embed(self, data: dict, author: discord.User) -> discord.Embed:
+    def create_competition_embed(self, data: dict, author: discord.User, ends_at: datetime) -> discord.Embed:
         """Helper to create the initial SOTW announcement embed."""
         embed = discord.Embed(
             title=f"New SOTW: {data['title']}",
@@ -125,7 +130,7 @@ class SOTW(commands.Cog):
             color=discord.Color.green()
         )
         embed.set_footer(text=f"Competition started by {author.display_name}", icon_url=author.display_avatar.url)
-        embed.timestamp = datetime.fromisoformat(data['endsAt'].replace('Z', '+00:00'))
+        embed.timestamp = ends_at
         return embed
 
     def create_leaderboard_embed(self, data: dict) -> discord.Embed:
@@ -138,13 +143,13 @@ class SOTW(commands.Cog):
 
         leaderboard_text = []
         for i, p in enumerate(data.get('participations', [])[:10]):
-            rank = {0: "🥇", 1: "🥈", 2: "🥉"}.get(i, f"**#{i+1}**")
-            gained_xp = p.get('progress', {}).get('gained', 0)
+            rank = RANK_EMOJIS[i] if i < 3 else f"**#{i+1}**"
+            gained_xp = p.get('progress', _NO_PROGRESS)['gained']
             leaderboard_text.append(f"{rank} **{p['player']['displayName']}**: `{gained_xp:,}` XP")
         
         embed.description = "\n".join(leaderboard_text) if leaderboard_text else "No participants have gained XP yet."
         embed.set_footer(text="Competition ends")
-        embed.timestamp = datetime.fromisoformat(data['endsAt'].replace('Z', '+00:00'))
+        embed.timestamp = datetime.fromisoformat(data['endsAt'])  # 3.11+ accepts WOM's trailing 'Z'
         return embed
 
 async def setup(bot: GrazyBot):
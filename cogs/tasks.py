@@ -1,12 +1,17 @@
 # cogs/tasks.py
 # Contains background tasks for managing events.
 
+import asyncio
 import logging
 import discord
 from discord.ext import tasks, commands
 import random
+from collections import defaultdict
 
 from core.bot import GrazyBot
+from core.bot_base import NO_EVENT_DUE
+from core.database import SELECT_ENDED_RAFFLES, SELECT_ENDED_COMPETITIONS, SELECT_ENDED_GIVEAWAYS, SELECT_NEXT_EVENT_DUE
+from core import config
 from utils import raffle as raffle_utils, wom as wom_utils, clan
 
 logger = logging.getLogger(__name__)
@@ -25,70 +30,159 @@ class Tasks(commands.Cog):
     async def event_manager(self):
         """
         A background loop that runs every minute to manage the state of various events.
+        Ticks before the earliest pending end time return without touching the database.
         """
+        due = self.bot.next_event_due
+        if due is not None and discord.utils.utcnow() < due:
+            return
+        # Events created while this tick runs lower this via bot.schedule_event_check.
+        self.bot.next_event_due = NO_EVENT_DUE
+        # The sections touch different tables and each takes its own pool connection, so run them together.
+        sections = (self.process_raffles, self.process_sotw, self.process_giveaways)
+        results = await asyncio.gather(*(section() for section in sections), return_exceptions=True)
+        failed = False
+        for section, result in zip(sections, results):
+            if isinstance(result, Exception):
+                failed = True
+                logger.error(f"Error in event_manager {section.__name__}: {result}", exc_info=result)
+        if failed:
+            self.bot.next_event_due = None  # Check again next tick
+            return
+
         try:
             async with self.bot.db_pool.acquire() as conn:
-                # --- Handle Ended Raffles ---
-                ended_raffles = await conn.fetch("SELECT id FROM raffles WHERE ends_at <= NOW() AND winner_id IS NULL")
-                if ended_raffles:
-                    logger.info(f"Found {len(ended_raffles)} ended raffle(s) to process.")
-                    for raffle in ended_raffles:
-                        await raffle_utils.draw_raffle_winner(self.bot, raffle['id'])
-
-                # --- Handle Ended SOTW Competitions ---
-                ended_sotw_records = await conn.fetch("SELECT id, competition_id FROM active_competitions WHERE ends_at <= NOW()")
-                if ended_sotw_records:
-                    logger.info(f"Found {len(ended_sotw_records)} ended SOTW competition(s) to process.")
-                    for sotw_record in ended_sotw_records:
-                        comp_data, error = await wom_utils.get_competition_details(sotw_record['competition_id'])
-                        if not error and comp_data:
-                            point_values = [100, 50, 25]
-                            for i, participant in enumerate(comp_data.get('participations', [])[:3]):
-                                osrs_name = participant['player']['displayName']
-                                user_data = await conn.fetchrow("SELECT discord_id FROM user_links WHERE osrs_name = $1", osrs_name)
-                                if user_data:
-                                    member = self.bot.get_guild(config.DEBUG_GUILD_ID).get_member(user_data['discord_id'])
-                                    if member:
-                                        reason = f"placing #{i+1} in the {comp_data['title']} SOTW"
-                                        await clan.award_points(self.bot, member, point_values[i], reason)
-                        await conn.execute("DELETE FROM active_competitions WHERE id = $1", sotw_record['id'])
-
-                # --- Handle Ended Giveaways ---
-                ended_giveaways = await conn.fetch("SELECT * FROM giveaways WHERE ends_at <= NOW() AND is_active = TRUE")
-                if ended_giveaways:
-                    logger.info(f"Found {len(ended_giveaways)} ended giveaway(s) to process.")
-                    for gw in ended_giveaways:
-                        gw_channel = self.bot.get_channel(gw['channel_id'])
-                        if not gw_channel:
-                            continue
-
-                        entrants = await conn.fetch("SELECT user_id FROM giveaway_entries WHERE giveaway_id = $1", gw['id'])
-                        if not entrants:
-                            await gw_channel.send(f"The giveaway for **{gw['prize']}** has ended, but no one entered.")
-                        else:
-                            winner_ids = random.sample([e['user_id'] for e in entrants], k=min(gw['winner_count'], len(entrants)))
-                            winners_mention = [f"<@{wid}>" for wid in winner_ids]
-
-                            win_embed = discord.Embed(
-                                title="🎉 Giveaway Winners! 🎉",
-                                description=f"Congratulations to {', '.join(winners_mention)}! You've won the **{gw['prize']}**!",
-                                color=discord.Color.gold()
-                            )
-                            await gw_channel.send(embed=win_embed)
-
-                            if gw['role_id']:
-                                role = gw_channel.guild.get_role(gw['role_id'])
-                                if role:
-                                    for winner_id in winner_ids:
-                                        member = gw_channel.guild.get_member(winner_id)
-                                        if member:
-                                            await member.add_roles(role)
-
-                        await conn.execute("UPDATE giveaways SET is_active = FALSE WHERE id = $1", gw['id'])
-
+                stmt = await conn.statement(SELECT_NEXT_EVENT_DUE)
+                next_due = await stmt.fetchval()
+            self.bot.next_event_due = min(next_due or NO_EVENT_DUE, self.bot.next_event_due)
         except Exception as e:
+            self.bot.next_event_due = None
             logger.error(f"Error in event_manager task: {e}", exc_info=True)
 
+    async def process_raffles(self):
+        """Draws a winner for every ended raffle."""
+        async with self.bot.db_pool.acquire() as conn:
+            stmt = await conn.statement(SELECT_ENDED_RAFFLES)
+            ended_raffles = await stmt.fetch()
+        if ended_raffles:
+            logger.info(f"Found {len(ended_raffles)} ended raffle(s) to process.")
+            # draw_raffle_winner takes its own connection
+            for raffle in ended_raffles:
+                await raffle_utils.draw_raffle_winner(self.bot, raffle['id'])
+
+    async def process_sotw(self):
+        """Awards the podium of every ended SOTW competition and removes them."""
+        async with self.bot.db_pool.acquire() as conn:
+            stmt = await conn.statement(SELECT_ENDED_COMPETITIONS)
+            ended_sotw_records = await stmt.fetch()
+            if not ended_sotw_records:
+                return
+            logger.info(f"Found {len(ended_sotw_records)} ended SOTW competition(s) to process.")
+            # Fetch every competition's results at once; utils.wom caps the in-flight requests.
+            results = await asyncio.gather(
+                *(wom_utils.get_competition_details(self.bot, r['competition_id']) for r in ended_sotw_records),
+                return_exceptions=True
+            )
+            podiums = []  # (competition title, top 3 participants)
+            for sotw_record, result in zip(ended_sotw_records, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to fetch results for SOTW competition {sotw_record['competition_id']}: {result}")
+                    continue
+                comp_data, error = result
+                if not error and comp_data:
+                    podiums.append((comp_data['title'], comp_data.get('participations', [])[:3]))
+            await self.award_sotw_winners(conn, podiums)
+            await conn.execute(
+                "DELETE FROM active_competitions WHERE id = ANY($1::int[])",
+                [r['id'] for r in ended_sotw_records]
+            )
+
+    async def process_giveaways(self):
+        """Picks and announces the winners of every ended giveaway."""
+        async with self.bot.db_pool.acquire() as conn:
+            stmt = await conn.statement(SELECT_ENDED_GIVEAWAYS)
+            ended_giveaways = await stmt.fetch()
+            if not ended_giveaways:
+                return
+            logger.info(f"Found {len(ended_giveaways)} ended giveaway(s) to process.")
+
+            # Giveaways whose channel is gone stay active and are retried next tick
+            ready = [(gw, channel) for gw in ended_giveaways if (channel := self.bot.get_channel(gw['channel_id']))]
+            if not ready:
+                return
+            ids = [gw['id'] for gw, _ in ready]
+            # Every ended giveaway's entrants in one query
+            entrants = defaultdict(list)
+            for row in await conn.fetch("SELECT giveaway_id, user_id FROM giveaway_entries WHERE giveaway_id = ANY($1::int[])", ids):
+                entrants[row['giveaway_id']].append(row['user_id'])
+
+            # Announcements are independent Discord requests; one failing doesn't hold up the rest.
+            results = await asyncio.gather(
+                *(self.announce_giveaway(gw, channel, entrants[gw['id']]) for gw, channel in ready),
+                return_exceptions=True
+            )
+            done = []
+            for (gw, _), result in zip(ready, results):
+                if isinstance(result, Exception):
+                    # Left active so the next tick tries again
+                    logger.error(f"Failed to announce giveaway {gw['id']}: {result}", exc_info=result)
+                else:
+                    done.append(gw)
+
+            await conn.execute("UPDATE giveaways SET is_active = FALSE WHERE id = ANY($1::int[])", [gw['id'] for gw in done])
+        for gw in done:
+            self.bot.giveaway_entries.pop(gw['message_id'], None)
+
+    async def announce_giveaway(self, gw, gw_channel: discord.abc.Messageable, entrant_ids: list[int]):
+        """Draws a giveaway's winners, announces them and grants the reward role."""
+        if not entrant_ids:
+            await gw_channel.send(f"The giveaway for **{gw['prize']}** has ended, but no one entered.")
+            return
+
+        winner_ids = random.sample(entrant_ids, k=min(gw['winner_count'], len(entrant_ids)))
+        winners_mention = [f"<@{wid}>" for wid in winner_ids]
+
+        win_embed = discord.Embed(
+            title="🎉 Giveaway Winners! 🎉",
+            description=f"Congratulations to {', '.join(winners_mention)}! You've won the **{gw['prize']}**!",
+            color=discord.Color.gold()
+        )
+        role = gw_channel.guild.get_role(gw['role_id']) if gw['role_id'] else None
+        reason = f"Won the giveaway for {gw['prize']}"
+        # Announce before granting anything: if the send fails the giveaway is retried with a fresh draw,
+        # so roles must only go to winners who were actually announced.
+        await gw_channel.send(embed=win_embed)
+        if role:
+            await asyncio.gather(*(self.give_role(gw_channel.guild, winner_id, role, reason) for winner_id in winner_ids))
+
+    async def give_role(self, guild: discord.Guild, user_id: int, role: discord.Role, reason: str = None):
+        """Adds role to a guild member, logging instead of raising so one failure doesn't stop the others."""
+        try:
+            # The member cache is a dict lookup; only members missing from it cost a REST fetch.
+            member = guild.get_member(user_id) or await guild.fetch_member(user_id)
+            if role not in member.roles:
+                await member.add_roles(role, reason=reason)
+        except discord.HTTPException as e:
+            logger.warning(f"Could not give role {role.name} to user {user_id}: {e}")
+
+    async def award_sotw_winners(self, conn, podiums: list[tuple[str, list[dict]]]):
+        """Awards points to the linked top 3 of each ended competition, looking up all links in one query."""
+        names = {p['player']['displayName'] for _, top in podiums for p in top}
+        if not names:
+            return
+        links = await conn.fetch("SELECT osrs_name, discord_id FROM user_links WHERE osrs_name = ANY($1::text[])", list(names))
+        discord_ids = {r['osrs_name']: r['discord_id'] for r in links}
+
+        guild = self.bot.get_guild(config.DEBUG_GUILD_ID)
+        point_values = [100, 50, 25]
+        awards = []
+        for title, top in podiums:
+            for i, participant in enumerate(top):
+                discord_id = discord_ids.get(participant['player']['displayName'])
+                member = guild.get_member(discord_id) if guild and discord_id else None
+                if member:
+                    awards.append((member, point_values[i], f"placing #{i+1} in the {title} SOTW"))
+        await clan.award_points_bulk(self.bot, awards)
+
     @event_manager.before_loop
     async def before_event_manager(self):
         """Wait until the bot is ready before starting the loop."""
@@ -1,19 +1,54 @@
 import discord
 from discord.ext import commands
+import aiohttp
 import os
 import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from collections import OrderedDict
+from datetime import datetime, timezone
 from dotenv import load_dotenv
 from core.database import create_db_pool
+from utils.outbox import MessageOutbox
+
+FETCHED_USER_CACHE_SIZE = 1024
+IMAGE_WORKERS = 2
+NO_EVENT_DUE = datetime.max.replace(tzinfo=timezone.utc)  # next_event_due when nothing is pending
 
 class GrazyBot(commands.Bot):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.db = None
+        self.http_session: aiohttp.ClientSession | None = None
+        self.proc_pool: ProcessPoolExecutor | None = None
+        self.outbox = MessageOutbox()  # Paced, coalesced edits for frequently updated messages
+        self.item_mapping = None  # utils.ge.ItemMapping, set by load_item_mapping
+        # Users known to be entered/signed up, so repeat button presses skip the database.
+        self.giveaway_entries: dict[int, set[int]] = {}  # giveaway message_id -> user ids
+        self.pvm_signups: dict[int, set[int]] = {}  # event_id -> user ids
+        # Earliest end time of any open raffle, SOTW or giveaway; None until the event manager has looked.
+        self.next_event_due: datetime | None = None
+        # (WOM competition id, ends_at) of the newest running SOTW, so /sotw view can skip the database.
+        self.current_sotw: tuple[int, datetime] | None = None
+        # Users fetched over REST because they weren't in the gateway cache, most recent last.
+        self._fetched_users: OrderedDict[int, discord.User] = OrderedDict()
 
     async def setup_hook(self):
         logging.info("Running setup_hook...")
-        self.db = await create_db_pool()
+        # core.bot.main() normally creates the pool (and applies schema.sql) before
+        # start(); reuse it so the schema bootstrap only runs once per startup.
+        self.db = getattr(self, "db_pool", None) or await create_db_pool()
+        self.db_pool = self.db
+        # One pooled, keep-alive session shared by every cog and helper for the bot's lifetime.
+        self.http_session = aiohttp.ClientSession(
+            headers={"User-Agent": "GrazyBot/2.0"},
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        # CPU-bound rendering (bingo boards) runs here, off the event loop's GIL.
+        # Spawned rather than forked: the bot process already has threads running.
+        self.proc_pool = ProcessPoolExecutor(max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
         cogs_dir = "cogs"
         for filename in os.listdir(cogs_dir):
             if filename.endswith(".py") and filename != "__init__.py":
@@ -24,8 +59,36 @@ class GrazyBot(commands.Bot):
                     logging.error(f"Failed to load extension {filename}: {e}")
         await self.tree.sync()
 
+    async def get_or_fetch_user(self, user_id: int) -> discord.User:
+        """
+        Returns a user from the gateway cache, falling back to a REST fetch.
+        Fetched users are kept in a small LRU so repeat winners don't cost another API call.
+        """
+        user = self.get_user(user_id)
+        if user:
+            return user
+        user = self._fetched_users.get(user_id)
+        if user:
+            self._fetched_users.move_to_end(user_id)
+            return user
+        user = await self.fetch_user(user_id)
+        self._fetched_users[user_id] = user
+        if len(self._fetched_users) > FETCHED_USER_CACHE_SIZE:
+            self._fetched_users.popitem(last=False)
+        return user
+
+    def schedule_event_check(self, ends_at: datetime):
+        """Makes sure the event manager wakes up for an event created with this end time."""
+        if self.next_event_due is not None and ends_at < self.next_event_due:
+            self.next_event_due = ends_at
+
     async def close(self):
         logging.info("Closing bot...")
+        self.outbox.close()
+        if self.http_session:
+            await self.http_session.close()
+        if self.proc_pool:
+            self.proc_pool.shutdown(wait=False, cancel_futures=True)
         if self.db:
             await self.db.close()
         await super().close()
@@ -1,10 +1,182 @@
 import asyncpg
+import orjson
 import os
 from dotenv import load_dotenv
 import logging
 
 logger = logging.getLogger(__name__)
 
+# --- Hot-path statements ---
+# These run on every button click or points award, so each pooled connection
+# prepares them once when it is opened instead of on first use.
+
+INSERT_GIVEAWAY_ENTRY = """
+    WITH gw AS (
+        SELECT id FROM giveaways WHERE message_id = $1 AND is_active = TRUE
+    ), ins AS (
+        INSERT INTO giveaway_entries (giveaway_id, user_id)
+        SELECT id, $2 FROM gw
+        ON CONFLICT (giveaway_id, user_id) DO NOTHING
+        RETURNING 1
+    )
+    SELECT EXISTS (SELECT 1 FROM gw) AS is_active, EXISTS (SELECT 1 FROM ins) AS entered
+"""
+INSERT_PVM_SIGNUP = (
+    "INSERT INTO pvm_event_signups (event_id, user_id) VALUES ($1, $2) "
+    "ON CONFLICT (event_id, user_id) DO NOTHING RETURNING 1"
+)
+DELETE_PVM_SIGNUP = "DELETE FROM pvm_event_signups WHERE event_id = $1 AND user_id = $2 RETURNING 1"
+INSERT_BINGO_SUBMISSION = (
+    "INSERT INTO bingo_submissions (event_id, user_id, task_name, proof_url) VALUES ($1, $2, $3, $4) RETURNING id"
+)
+# Only pending submissions change, so a second click on a reviewed one returns no row.
+APPROVE_BINGO_SUBMISSION = """
+    WITH sub AS (
+        UPDATE bingo_submissions SET status = 'approved'
+        WHERE id = $1 AND status = 'pending'
+        RETURNING event_id, user_id, task_name
+    ), tile AS (
+        INSERT INTO bingo_completed_tiles (event_id, user_id, task_name)
+        SELECT event_id, user_id, task_name FROM sub
+    )
+    SELECT user_id, task_name FROM sub
+"""
+REJECT_BINGO_SUBMISSION = (
+    "UPDATE bingo_submissions SET status = 'rejected' WHERE id = $1 AND status = 'pending' RETURNING user_id, task_name"
+)
+AWARD_POINTS_UPSERT = (
+    "INSERT INTO clan_points (discord_id, points) VALUES ($1, $2) "
+    "ON CONFLICT (discord_id) DO UPDATE SET points = clan_points.points + EXCLUDED.points "
+    "RETURNING points"
+)
+# Balances never go below zero; a member with no row gets one at zero.
+REMOVE_POINTS_UPSERT = (
+    "INSERT INTO clan_points (discord_id, points) VALUES ($1, 0) "
+    "ON CONFLICT (discord_id) DO UPDATE SET points = GREATEST(0, clan_points.points - $2) "
+    "RETURNING points"
+)
+# Enters a member into the current raffle unless they already hold $2 self-claimed tickets.
+# Returns no row when there is no open raffle.
+ENTER_RAFFLE = """
+    WITH raffle AS (
+        SELECT id, prize FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1
+    ), claimed AS (
+        INSERT INTO raffle_entries AS e (raffle_id, user_id, tickets, self_tickets)
+        SELECT raffle.id, $1, 1, 1 FROM raffle
+        ON CONFLICT (raffle_id, user_id) DO UPDATE
+            SET tickets = e.tickets + 1, self_tickets = e.self_tickets + 1
+            WHERE e.self_tickets < $2
+        RETURNING e.tickets
+    )
+    SELECT raffle.prize,
+           COALESCE((SELECT tickets FROM claimed),
+                    (SELECT tickets FROM raffle_entries e WHERE e.raffle_id = raffle.id AND e.user_id = $1)) AS total_tickets,
+           EXISTS (SELECT 1 FROM claimed) AS entered
+    FROM raffle
+"""
+# Gives a member $2 admin tickets in the current raffle, returning their new total (no row if none is open).
+GIVE_RAFFLE_TICKETS = """
+    INSERT INTO raffle_entries AS e (raffle_id, user_id, tickets)
+    SELECT id, $1, $2 FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1
+    ON CONFLICT (raffle_id, user_id) DO UPDATE SET tickets = e.tickets + EXCLUDED.tickets
+    RETURNING e.tickets AS total_tickets
+"""
+# Picks a raffle's winner with probability proportional to their tickets: each entrant draws an
+# exponential with rate = tickets and the smallest wins. 1 - random() keeps ln() away from 0.
+DRAW_RAFFLE_WINNER = """
+    SELECT user_id FROM raffle_entries
+    WHERE raffle_id = $1 AND tickets > 0
+    ORDER BY -ln(1.0 - random()) / tickets
+    LIMIT 1
+"""
+
+# Lookups behind the most-used read commands (/events view, /raffle view_tickets, /points view, /store redeem).
+# One round trip for every event type. Each column is the full table row (decoded as a Record) or NULL.
+SELECT_ACTIVE_EVENTS = """
+    SELECT
+        (SELECT c FROM active_competitions c WHERE ends_at > NOW() ORDER BY ends_at DESC LIMIT 1) AS comp,
+        (SELECT r FROM raffles r WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1) AS raf,
+        (SELECT g FROM giveaways g WHERE is_active = TRUE AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1) AS giveaway,
+        (SELECT p FROM pvm_events p WHERE is_active = TRUE AND starts_at > NOW() ORDER BY starts_at ASC LIMIT 1) AS pvm_event
+"""
+SELECT_OPEN_RAFFLE = "SELECT id, prize FROM raffles WHERE winner_id IS NULL AND ends_at > NOW() ORDER BY ends_at DESC LIMIT 1"
+SELECT_RAFFLE_TICKETS = (
+    "SELECT user_id, tickets AS count FROM raffle_entries WHERE raffle_id = $1 AND tickets > 0 ORDER BY tickets DESC"
+)
+SELECT_POINTS = "SELECT points FROM clan_points WHERE discord_id = $1"
+# role_rewards is keyed on reward_id, so the join adds at most the reward's one role.
+SELECT_ACTIVE_REWARD = """
+    SELECT r.*, rr.role_id
+    FROM rewards r
+    LEFT JOIN role_rewards rr ON r.id = rr.reward_id
+    WHERE r.reward_name ILIKE $1 AND r.is_active = TRUE
+"""
+
+# event_manager's polling queries. They run for the bot's whole lifetime, so they go
+# through GrazyConnection.statement too, prepared on whichever connection first runs them.
+SELECT_ENDED_RAFFLES = "SELECT id FROM raffles WHERE ends_at <= NOW() AND winner_id IS NULL"
+SELECT_ENDED_COMPETITIONS = "SELECT id, competition_id FROM active_competitions WHERE ends_at <= NOW()"
+SELECT_ENDED_GIVEAWAYS = (
+    "SELECT id, message_id, channel_id, prize, winner_count, role_id "
+    "FROM giveaways WHERE ends_at <= NOW() AND is_active = TRUE"
+)
+# LEAST skips NULLs, so this is NULL only when nothing at all is pending.
+SELECT_NEXT_EVENT_DUE = """
+    SELECT LEAST(
+        (SELECT MIN(ends_at) FROM raffles WHERE winner_id IS NULL),
+        (SELECT MIN(ends_at) FROM active_competitions),
+        (SELECT MIN(ends_at) FROM giveaways WHERE is_active)
+    )
+"""
+
+# Prepared on every new pool connection. Statements that reference a table's columns with
+# SELECT * are safe here because schema.sql is applied before the pool opens.
+PREPARED_STATEMENTS = (
+    INSERT_GIVEAWAY_ENTRY,
+    INSERT_PVM_SIGNUP,
+    DELETE_PVM_SIGNUP,
+    INSERT_BINGO_SUBMISSION,
+    APPROVE_BINGO_SUBMISSION,
+    REJECT_BINGO_SUBMISSION,
+    AWARD_POINTS_UPSERT,
+    REMOVE_POINTS_UPSERT,
+    ENTER_RAFFLE,
+    GIVE_RAFFLE_TICKETS,
+    SELECT_ACTIVE_EVENTS,
+    SELECT_OPEN_RAFFLE,
+    SELECT_RAFFLE_TICKETS,
+    SELECT_POINTS,
+    SELECT_ACTIVE_REWARD,
+)
+
+class GrazyConnection(asyncpg.Connection):
+    """Pool connection that keeps its prepared statements for its whole lifetime."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prepared = {}
+
+    async def statement(self, query: str) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Returns the prepared statement for query, preparing it on first use."""
+        stmt = self._prepared.get(query)
+        if stmt is None:
+            stmt = self._prepared[query] = await self.prepare(query)
+        return stmt
+
+async def _init_connection(conn: GrazyConnection):
+    """
+    Pool init callback, run on each new connection: JSONB columns are decoded with orjson
+    straight into Python objects, and the hot-path statements are prepared.
+    """
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=lambda value: orjson.dumps(value).decode(),
+        decoder=orjson.loads,
+        schema='pg_catalog'
+    )
+    for query in PREPARED_STATEMENTS:
+        await conn.statement(query)
+
 async def create_db_pool():
     """
     Creates and returns a connection pool to the PostgreSQL database.
@@ -19,19 +191,16 @@ async def create_db_pool():
     
     logger.info(f"Attempting to connect to database with URL: {db_url.split('@')[1] if db_url else 'None'}")
     try:
-        pool = await asyncpg.create_pool(
-            dsn=db_url,
-            min_size=5,
-            max_size=20,
-            command_timeout=60
-        )
-        logger.info("Database connection pool created successfully")
-
-        # Apply schema
+        # Apply schema first: pool connections prepare statements against these tables.
+        # With no arguments asyncpg uses the simple query protocol, so the whole
+        # multi-statement file goes to Postgres in a single round trip.
         try:
-            async with pool.acquire() as conn:
+            conn = await asyncpg.connect(dsn=db_url)
+            try:
                 with open('schema.sql', 'r') as f:
                     await conn.execute(f.read())
+            finally:
+                await conn.close()
             logger.info("Database schema applied successfully")
         except FileNotFoundError:
             logger.error("schema.sql not found. Cannot apply database schema")
@@ -40,6 +209,16 @@ async def create_db_pool():
             logger.error(f"Failed to apply database schema: {e}")
             raise
 
+        pool = await asyncpg.create_pool(
+            dsn=db_url,
+            min_size=5,
+            max_size=20,
+            command_timeout=60,
+            connection_class=GrazyConnection,
+            init=_init_connection
+        )
+        logger.info("Database connection pool created successfully")
+
         return pool
     except (asyncpg.PostgresError, OSError) as e:
         logger.error(f"Failed to create database connection pool: {e}")
@@ -49,19 +49,20 @@ CREATE TABLE IF NOT EXISTS raffles (
     winner_id BIGINT
 );
 
--- Table to store raffle entries
+-- Table to store raffle entries: one row per member per raffle holding their ticket count
 CREATE TABLE IF NOT EXISTS raffle_entries (
-    id SERIAL PRIMARY KEY,
     raffle_id INTEGER REFERENCES raffles(id) ON DELETE CASCADE,
     user_id BIGINT NOT NULL,
-    source VARCHAR(20) NOT NULL -- 'self' or 'admin'
+    tickets INTEGER NOT NULL DEFAULT 0,
+    self_tickets INTEGER NOT NULL DEFAULT 0, -- How many of the tickets came from /raffle enter
+    PRIMARY KEY (raffle_id, user_id)
 );
 
 -- Table to store information about bingo events
 CREATE TABLE IF NOT EXISTS bingo_events (
     id SERIAL PRIMARY KEY,
     ends_at TIMESTAMP WITH TIME ZONE NOT NULL,
-    board_json TEXT NOT NULL,
+    board_json JSONB NOT NULL,
     message_id BIGINT,
     channel_id BIGINT,
     is_active BOOLEAN NOT NULL DEFAULT TRUE
@@ -138,4 +139,62 @@ CREATE TABLE IF NOT EXISTS redeem_transactions (
     reward_name VARCHAR(255) NOT NULL,
     point_cost INTEGER NOT NULL,
     redeemed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
-);
\ No newline at end of file
+);
+
+-- One entry per user per giveaway / signup per user per PVM event.
+-- Lets the entry buttons use INSERT ... ON CONFLICT DO NOTHING instead of a SELECT first.
+-- Older databases could hold duplicates, which would stop the index building, so keep
+-- the first row of each before creating it. Once the index exists this is skipped.
+DO $$
+BEGIN
+    IF to_regclass('giveaway_entries_giveaway_user_idx') IS NULL THEN
+        DELETE FROM giveaway_entries WHERE ctid NOT IN (
+            SELECT min(ctid) FROM giveaway_entries GROUP BY giveaway_id, user_id
+        );
+        CREATE UNIQUE INDEX giveaway_entries_giveaway_user_idx ON giveaway_entries (giveaway_id, user_id);
+    END IF;
+    IF to_regclass('pvm_event_signups_event_user_idx') IS NULL THEN
+        DELETE FROM pvm_event_signups WHERE ctid NOT IN (
+            SELECT min(ctid) FROM pvm_event_signups GROUP BY event_id, user_id
+        );
+        CREATE UNIQUE INDEX pvm_event_signups_event_user_idx ON pvm_event_signups (event_id, user_id);
+    END IF;
+END $$;
+
+-- Partial indexes for the once-a-minute event_manager poll and the /events lookups,
+-- covering only the rows that are still pending so they stay small.
+CREATE INDEX IF NOT EXISTS active_competitions_ends_at_idx ON active_competitions (ends_at);
+CREATE INDEX IF NOT EXISTS giveaways_active_ends_at_idx ON giveaways (ends_at) WHERE is_active;
+CREATE INDEX IF NOT EXISTS raffles_open_ends_at_idx ON raffles (ends_at) WHERE winner_id IS NULL;
+CREATE INDEX IF NOT EXISTS pvm_events_active_starts_at_idx ON pvm_events (starts_at) WHERE is_active;
+
+-- board_json used to be TEXT; convert existing databases so asyncpg decodes it natively.
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'bingo_events' AND column_name = 'board_json') = 'text' THEN
+        ALTER TABLE bingo_events ALTER COLUMN board_json TYPE JSONB USING board_json::jsonb;
+    END IF;
+END $$;
+
+-- raffle_entries used to hold one row per ticket; fold existing databases into per-member counts.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_name = 'raffle_entries' AND column_name = 'source') THEN
+        ALTER TABLE raffle_entries RENAME TO raffle_entries_old;
+        ALTER TABLE raffle_entries_old RENAME CONSTRAINT raffle_entries_pkey TO raffle_entries_old_pkey;
+        CREATE TABLE raffle_entries (
+            raffle_id INTEGER REFERENCES raffles(id) ON DELETE CASCADE,
+            user_id BIGINT NOT NULL,
+            tickets INTEGER NOT NULL DEFAULT 0,
+            self_tickets INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (raffle_id, user_id)
+        );
+        INSERT INTO raffle_entries (raffle_id, user_id, tickets, self_tickets)
+        SELECT raffle_id, user_id, COUNT(*), COUNT(*) FILTER (WHERE source = 'self')
+        FROM raffle_entries_old WHERE raffle_id IS NOT NULL
+        GROUP BY raffle_id, user_id;
+        DROP TABLE raffle_entries_old;
+    END IF;
+END $$;
@@ -0,0 +1,38 @@
+# tests/test_cogs/test_bingo.py
+# Tests for the bingo task file loading in the bingo.py cog.
+
+import json
+import os
+import pytest
+from cogs import bingo
+
+
+class TestLoadTasksByDifficulty:
+    """Test suite for the cached tasks.json loader."""
+
+    @pytest.fixture(autouse=True)
+    def tasks_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(bingo, "_tasks_cache", None)
+        path = tmp_path / bingo.TASKS_FILE
+        path.write_text(json.dumps([{"name": "a", "difficulty": "rare"}, {"name": "b"}]))
+        return path
+
+    def test_tasks_are_grouped_by_difficulty(self):
+        """Test that tasks without a difficulty count as common."""
+        tasks = bingo.load_tasks_by_difficulty()
+        assert [t["name"] for t in tasks["common"]] == ["b"]
+        assert [t["name"] for t in tasks["rare"]] == ["a"]
+        assert tasks["uncommon"] == []
+
+    def test_unchanged_file_is_not_reread(self):
+        """Test that a second load with the same mtime returns the cached buckets."""
+        assert bingo.load_tasks_by_difficulty() is bingo.load_tasks_by_difficulty()
+
+    def test_edited_file_is_reread(self, tasks_file):
+        """Test that a new mtime picks up the edited tasks."""
+        bingo.load_tasks_by_difficulty()
+        tasks_file.write_text(json.dumps([{"name": "c", "difficulty": "uncommon"}]))
+        mtime = os.stat(tasks_file).st_mtime
+        os.utime(tasks_file, (mtime + 1, mtime + 1))
+        assert [t["name"] for t in bingo.load_tasks_by_difficulty()["uncommon"]] == ["c"]
@@ -0,0 +1,36 @@
+# tests/test_cogs/test_ge.py
+# Tests for the item list parsing in the ge.py cog.
+
+import pytest
+from cogs.ge import ITEM_LIST_RE, parse_quantity
+
+
+class TestItemListRegex:
+    """Test suite for the /ge value item list pattern."""
+
+    def test_comma_separated_items(self):
+        """Test that comma separated entries split into (quantity, name) pairs."""
+        assert ITEM_LIST_RE.findall("10k raw sharks, 1 twisted bow") == [("10k", "raw sharks"), ("1", "twisted bow")]
+
+    def test_and_separator_is_trimmed(self):
+        """Test that 'and' separates entries without leaving trailing spaces."""
+        assert ITEM_LIST_RE.findall("1,000 feathers and 5 abyssal whip") == [("1,000", "feathers"), ("5", "abyssal whip")]
+
+    @pytest.mark.parametrize("text, name", [("1 sandstone", "sandstone"), ("3 bandos tassets", "bandos tassets")])
+    def test_and_inside_a_name_is_not_a_separator(self, text, name):
+        """Test that names containing 'and' aren't cut short."""
+        assert ITEM_LIST_RE.findall(text) == [(text.split(" ", 1)[0], name)]
+
+
+class TestParseQuantity:
+    """Test suite for /ge value quantity parsing."""
+
+    @pytest.mark.parametrize("text, expected", [("10", 10), ("1,000", 1000), ("10k", 10_000), ("2.1m", 2_100_000), ("0.5k", 500)])
+    def test_valid_quantities_are_exact(self, text, expected):
+        """Test that plain, comma separated and suffixed quantities parse to exact ints."""
+        assert parse_quantity(text) == expected
+
+    @pytest.mark.parametrize("text", ["1.2.3", ".", "k"])
+    def test_invalid_quantities(self, text):
+        """Test that malformed quantities return None."""
+        assert parse_quantity(text) is None
@@ -0,0 +1,99 @@
+# tests/test_utils/test_ai.py
+# Unit tests for the Gemini response cache in the AI utility functions.
+
+import unittest
+from unittest import mock
+
+from utils import ai
+
+class FakeModel:
+    """Stands in for the Gemini model, counting calls."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        return mock.Mock(text=self.text)
+
+class TestAnnouncementCache(unittest.IsolatedAsyncioTestCase):
+    """Test suite for generate_announcement_json caching."""
+
+    def setUp(self):
+        ai._response_cache.clear()
+        self.model = FakeModel('```json{"title": "Raffle", "description": "Win!", "color": 1}```')
+        patcher = mock.patch.object(ai, "ai_model", self.model)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_repeat_request_hits_cache(self):
+        """Test that identical event type and details only call Gemini once."""
+        first = await ai.generate_announcement_json("raffle_start", {"prize": "Bond", "id": 1})
+        second = await ai.generate_announcement_json("raffle_start", {"id": 1, "prize": "Bond"})
+        self.assertEqual(first, second)
+        self.assertEqual(self.model.calls, 1)
+
+    async def test_different_details_miss(self):
+        """Test that different details are cached separately."""
+        await ai.generate_announcement_json("raffle_start", {"prize": "Bond"})
+        await ai.generate_announcement_json("raffle_start", {"prize": "Whip"})
+        self.assertEqual(self.model.calls, 2)
+
+    async def test_cached_dict_is_not_shared(self):
+        """Test that mutating a returned embed doesn't change later hits."""
+        first = await ai.generate_announcement_json("sotw_poll")
+        first["description"] += " edited"
+        second = await ai.generate_announcement_json("sotw_poll")
+        self.assertEqual(second["description"], "Win!")
+
+    async def test_non_str_keys_do_not_raise(self):
+        """Test that details with non-str keys are still cached instead of raising."""
+        first = await ai.generate_announcement_json("raffle_start", {1: "Bond", "prize": "Whip"})
+        await ai.generate_announcement_json("raffle_start", {1: "Bond", "prize": "Whip"})
+        self.assertEqual(first["title"], "Raffle")
+        self.assertEqual(self.model.calls, 1)
+
+    async def test_expired_entry_is_refetched(self):
+        """Test that entries older than the TTL trigger a new call."""
+        await ai.generate_announcement_json("sotw_poll")
+        with mock.patch.object(ai.time, "monotonic", return_value=ai.time.monotonic() + ai.RESPONSE_CACHE_TTL + 1):
+            await ai.generate_announcement_json("sotw_poll")
+        self.assertEqual(self.model.calls, 2)
+
+class TestExtractJson(unittest.TestCase):
+    """Test suite for pulling the embed JSON out of a Gemini reply."""
+
+    def test_fenced_block_with_surrounding_text(self):
+        """Test that a fenced block is found even with prose around it."""
+        text = 'Here you go:\n```json\n{"title": "Hi"}\n```\nEnjoy!'
+        self.assertEqual(ai._extract_json(text), {"title": "Hi"})
+
+    def test_fence_without_language(self):
+        """Test that a bare ``` fence is accepted."""
+        self.assertEqual(ai._extract_json('```\n{"color": 1}\n```'), {"color": 1})
+
+    def test_unfenced_json(self):
+        """Test that plain JSON falls through to a direct parse."""
+        self.assertEqual(ai._extract_json('  {"description": "json"}  '), {"description": "json"})
+
+class TestFallbackEmbed(unittest.TestCase):
+    """Test suite for the static fallback embeds."""
+
+    def test_placeholders_are_filled(self):
+        """Test that templated fields are formatted with the details."""
+        embed = ai._fallback_embed("raffle_start", {"prize": "Bond"})
+        self.assertEqual(embed["description"], "A new raffle for **Bond** has started!")
+        self.assertEqual(embed["color"], 0x9b59b6)
+
+    def test_missing_details_render_blank(self):
+        """Test that a placeholder missing from details doesn't raise."""
+        embed = ai._fallback_embed("sotw_start", {})
+        self.assertEqual(embed["description"], "A new Skill of the Week competition for **** has begun!")
+
+    def test_static_fallback_is_unchanged(self):
+        """Test that fallbacks without placeholders are returned verbatim, braces in details and all."""
+        self.assertEqual(ai._fallback_embed("sotw_poll", {"x": "{y}"}), ai.EMBED_FALLBACKS["sotw_poll"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+# tests/test_utils/test_ge.py
+# Unit tests for the Grand Exchange utility functions.
+
+import aiohttp
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from utils import ge
+from utils.ge import ItemMapping
+
+SAMPLE_ITEMS = [
+    {"id": 4151, "name": "Abyssal whip", "limit": 70, "members": True, "icon": "Abyssal whip.png"},
+    {"id": 1965, "name": "Cabbage", "limit": 13000, "members": False, "icon": "Cabbage.png"},
+    {"id": 20997, "name": "Twisted bow", "members": True},
+]
+
+class TestItemMapping(unittest.TestCase):
+    """Test suite for the columnar item mapping."""
+
+    def setUp(self):
+        self.mapping = ItemMapping(SAMPLE_ITEMS)
+
+    def test_lookup_is_case_insensitive(self):
+        """Test that lookups ignore the case of the item name."""
+        self.assertEqual(self.mapping.lookup("ABYSSAL WHIP")["id"], 4151)
+        self.assertEqual(self.mapping.lookup("abyssal whip")["name"], "Abyssal whip")
+
+    def test_lookup_round_trips_fields(self):
+        """Test that every stored column comes back for an item."""
+        self.assertEqual(
+            self.mapping.lookup("cabbage"),
+            {"id": 1965, "name": "Cabbage", "limit": 13000, "members": False, "icon": "Cabbage.png"},
+        )
+
+    def test_lookup_missing_optional_fields(self):
+        """Test that items without a limit or icon still resolve."""
+        item = self.mapping.lookup("twisted bow")
+        self.assertIsNone(item["limit"])
+        self.assertIsNone(item["icon"])
+        self.assertTrue(item["members"])
+
+    def test_lookup_unknown_item(self):
+        """Test that unknown names return None."""
+        self.assertIsNone(self.mapping.lookup("dragon claws"))
+
+    def test_keys_and_len(self):
+        """Test that keys are the lowercase names in catalogue order."""
+        self.assertEqual(len(self.mapping), 3)
+        self.assertEqual(self.mapping.keys(), ["abyssal whip", "cabbage", "twisted bow"])
+
+class TestStartingWith(unittest.TestCase):
+    """Test suite for the bisect prefix search."""
+
+    def setUp(self):
+        self.mapping = ItemMapping(SAMPLE_ITEMS + [{"id": 11802, "name": "Armadyl godsword"}, {"id": 11785, "name": "Armadyl crossbow"}])
+
+    def test_prefix_matches_are_sorted(self):
+        self.assertEqual(self.mapping.starting_with("arm", 25), ["armadyl crossbow", "armadyl godsword"])
+
+    def test_limit_is_respected(self):
+        self.assertEqual(self.mapping.starting_with("a", 2), ["abyssal whip", "armadyl crossbow"])
+
+    def test_no_match(self):
+        self.assertEqual(self.mapping.starting_with("zz", 25), [])
+
+    def test_search_exact_then_prefix(self):
+        self.assertEqual(self.mapping.search("Cabbage")["id"], 1965)
+        self.assertEqual(self.mapping.search("twisted")["id"], 20997)
+
+    def test_search_by_words(self):
+        self.assertEqual(self.mapping.search("godsword armadyl")["id"], 11802)
+
+    def test_search_substring_fallback(self):
+        self.assertEqual(self.mapping.search("ossbo")["id"], 11785)
+        self.assertIsNone(self.mapping.search("dragon"))
+
+class FakeResponse:
+    def __init__(self, body: bytes):
+        self.body = body
+        self.status = 200
+        self.request_info = None
+        self.history = ()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+class FakeSession:
+    """Stands in for the bot's aiohttp session, counting requests."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        return FakeResponse(self.body)
+
+class TestLatestPrices(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the cached bulk price fetch."""
+
+    def setUp(self):
+        ge._price_cache = (0.0, {})
+        self.session = FakeSession(b'{"data": {"4151": {"high": 1500000, "low": 1450000}}}')
+        self.bot = SimpleNamespace(http_session=self.session)
+
+    async def test_prices_are_keyed_by_id(self):
+        prices = await ge.get_latest_prices(self.bot)
+        self.assertEqual(prices["4151"]["high"], 1500000)
+
+    async def test_repeat_lookups_share_one_request(self):
+        await ge.get_latest_prices(self.bot)
+        await ge.get_latest_prices(self.bot)
+        self.assertEqual(self.session.calls, 1)
+
+    async def test_expired_cache_refetches(self):
+        await ge.get_latest_prices(self.bot)
+        with mock.patch.object(ge.time, "monotonic", return_value=ge.time.monotonic() + ge.PRICE_CACHE_TTL + 1):
+            await ge.get_latest_prices(self.bot)
+        self.assertEqual(self.session.calls, 2)
+
+    async def test_non_json_body_is_a_client_error(self):
+        self.session.body = b"<html>Bad Gateway</html>"
+        with self.assertRaises(aiohttp.ClientError):
+            await ge.get_latest_prices(self.bot)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+# tests/test_utils/test_osrs.py
+# Unit tests for the OSRS utility functions.
+
+import unittest
+
+from utils.osrs import chunk_lines, format_skill_list, MAX_FIELD_LENGTH
+
+class TestOsrsUtils(unittest.TestCase):
+    """Test suite for OSRS utility functions."""
+
+    def test_format_skill_list_single_block(self):
+        """Test that a short skill list fits in one block."""
+        skills_data = {"attack": {"level": 99, "xp": 13034431}, "magic": {"level": 75, "xp": 1210421}}
+        blocks = format_skill_list(["attack", "magic"], skills_data)
+        self.assertEqual(blocks, ["**Attack**: 99 (XP: 13,034,431)\n**Magic**: 75 (XP: 1,210,421)\n"])
+
+    def test_format_skill_list_skips_missing_skills(self):
+        """Test that skills without data are left out."""
+        blocks = format_skill_list(["attack", "magic"], {"magic": {"level": 1, "xp": 0}})
+        self.assertEqual(blocks, ["**Magic**: 1 (XP: 0)\n"])
+
+    def test_format_skill_list_splits_at_field_limit(self):
+        """Test that blocks never exceed the embed field limit and keep every line."""
+        skills = [f"skill{i}" for i in range(100)]
+        skills_data = {s: {"level": 99, "xp": 200000000} for s in skills}
+        blocks = format_skill_list(skills, skills_data)
+        self.assertGreater(len(blocks), 1)
+        self.assertTrue(all(len(b) <= MAX_FIELD_LENGTH for b in blocks))
+        self.assertEqual("".join(blocks).count("\n"), len(skills))
+
+    def test_format_skill_list_empty(self):
+        """Test that no matching skills produce no blocks."""
+        self.assertEqual(format_skill_list(["attack"], {}), [])
+
+    def test_chunk_lines_packs_to_limit(self):
+        """Test that lines are packed greedily without exceeding the limit."""
+        self.assertEqual(chunk_lines(["aa\n", "bb\n", "cc\n"], limit=6), ["aa\nbb\n", "cc\n"])
+
+    def test_chunk_lines_oversized_line(self):
+        """Test that a line longer than the limit still gets its own block."""
+        self.assertEqual(chunk_lines(["a\n", "toolong\n", "b\n"], limit=4), ["a\n", "toolong\n", "b\n"])
+
+    def test_chunk_lines_empty(self):
+        """Test that no lines produce no blocks."""
+        self.assertEqual(chunk_lines(iter(())), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# tests/test_utils/test_outbox.py
+# Unit tests for the coalescing message edit outbox.
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from utils.outbox import MessageOutbox
+
+class FakeMessage:
+    """Stands in for a discord.Message, recording its edits."""
+
+    def __init__(self, message_id: int, channel_id: int, edits: list):
+        self.id = message_id
+        self.channel = SimpleNamespace(id=channel_id)
+        self.edits = edits
+
+    async def edit(self, **fields):
+        if "error" in fields:
+            raise fields["error"]
+        self.edits.append((self.id, fields))
+
+class TestMessageOutbox(unittest.IsolatedAsyncioTestCase):
+    """Test suite for MessageOutbox."""
+
+    async def asyncSetUp(self):
+        self.outbox = MessageOutbox(interval=0.01)
+        self.addCleanup(self.outbox.close)
+        self.edits = []
+
+    async def test_pending_edits_are_coalesced(self):
+        """Test that only the latest of several queued edits is sent."""
+        first = FakeMessage(1, 10, self.edits)
+        second = FakeMessage(2, 10, self.edits)
+        self.outbox.enqueue_edit(first, content="a")
+        self.outbox.enqueue_edit(second, content="x")
+        self.outbox.enqueue_edit(second, content="y")
+        self.outbox.enqueue_edit(second, content="z")
+        await asyncio.sleep(0.1)
+        self.assertEqual(self.edits, [(1, {"content": "a"}), (2, {"content": "z"})])
+
+    async def test_edit_after_send_is_sent_again(self):
+        """Test that an edit queued after the previous one went out isn't dropped."""
+        message = FakeMessage(1, 10, self.edits)
+        self.outbox.enqueue_edit(message, content="a")
+        await asyncio.sleep(0.05)
+        self.outbox.enqueue_edit(message, content="b")
+        await asyncio.sleep(0.05)
+        self.assertEqual([fields["content"] for _, fields in self.edits], ["a", "b"])
+
+    async def test_unexpected_error_does_not_stop_the_channel(self):
+        """Test that a non-HTTP failure is logged and later edits in the channel still go out."""
+        failing = FakeMessage(1, 10, self.edits)
+        message = FakeMessage(2, 10, self.edits)
+        with self.assertLogs("utils.outbox", level="ERROR"):
+            self.outbox.enqueue_edit(failing, error=TypeError("bad field"))
+            self.outbox.enqueue_edit(message, content="a")
+            await asyncio.sleep(0.05)
+        self.assertEqual(self.edits, [(2, {"content": "a"})])
+
+    async def test_dead_worker_is_replaced(self):
+        """Test that an edit queued after a channel's worker died starts a new one."""
+        message = FakeMessage(1, 10, self.edits)
+        self.outbox.enqueue_edit(message, content="a")
+        self.outbox._workers[10].cancel()
+        await asyncio.sleep(0.01)
+        self.assertNotIn(10, self.outbox._queues)
+        self.outbox.enqueue_edit(message, content="b")
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.edits, [(1, {"content": "b"})])
+
+    async def test_on_sent_only_follows_a_successful_edit(self):
+        """Test that on_sent runs after a sent edit but not after a failed or replaced one."""
+        sent = []
+        message = FakeMessage(1, 10, self.edits)
+        self.outbox.enqueue_edit(message, on_sent=lambda: sent.append("replaced"), content="a")
+        self.outbox.enqueue_edit(message, on_sent=lambda: sent.append("ok"), content="b")
+        await asyncio.sleep(0.05)
+        with self.assertLogs("utils.outbox", level="ERROR"):
+            self.outbox.enqueue_edit(message, on_sent=lambda: sent.append("failed"), error=ValueError("bad"))
+            await asyncio.sleep(0.05)
+        self.assertEqual(sent, ["ok"])
+
+if __name__ == '__main__':
+    unittest.main()
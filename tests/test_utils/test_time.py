@@ -2,11 +2,12 @@
 # Unit tests for the time utility functions.
 
 import unittest
+import time
 from datetime import timedelta
 
 # By running pytest from the root directory, it will automatically handle the pathing.
 # We no longer need to modify sys.path here.
-from utils.time import parse_duration
+from utils.time import parse_duration, format_timestamp
 
 class TestTimeUtils(unittest.TestCase):
     """Test suite for time utility functions."""
@@ -43,5 +44,19 @@ class TestTimeUtils(unittest.TestCase):
         self.assertIsNone(parse_duration(""))    # Empty string
         self.assertIsNone(parse_duration("1.5d"))# Floats not supported by this simple parser
 
+    def test_format_timestamp_relative(self):
+        """Test relative formatting across each unit boundary."""
+        now = int(time.time())
+        self.assertEqual(format_timestamp(now - 10), "Just now")
+        self.assertEqual(format_timestamp(now - 120), "2 minutes ago")
+        self.assertEqual(format_timestamp(now - 3600), "1 hour ago")
+        self.assertEqual(format_timestamp(now - 86400), "1 day ago")
+        self.assertEqual(format_timestamp(now - 3 * 86400), "3 days ago")
+
+    def test_format_timestamp_full_and_empty(self):
+        """Test the absolute format and the empty-timestamp fallback."""
+        self.assertEqual(format_timestamp(0, "full"), "N/A")
+        self.assertEqual(format_timestamp(86400, "full"), "1970-01-02 00:00 UTC")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
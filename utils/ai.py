@@ -2,9 +2,16 @@
 # Contains helper functions for interacting with the Google Gemini API.
 
 import google.generativeai as genai
-import json
+import copy
+import heapq
+import orjson
 import logging
+import re
+import time
+from collections import OrderedDict
+from operator import itemgetter
 from core import config
+from .osrs import skill_display
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,63 @@ EMBED_FALLBACKS = {
     "pvm_event_start": {"title": "New PVM Event: {title}!", "description": "{description}", "color": 0xe67e22},
 }
 
+PERSONA_PROMPT = """
+You are TaskmasterGPT, the grandmaster of clan events for a Discord server.
+Your tone is epic, engaging, and highly detailed.
+Your task is to generate a JSON object for a Discord embed with "title", "description", and "color" keys (as an integer).
+Use vivid language and Discord markdown. Do not use emojis.
+"""
+ANNOUNCEMENT_PROMPT = PERSONA_PROMPT + "\n\nRequest: Generate an embed for an event of type '{event_type}' with details: {details}\n\nJSON Output:"
+
+# Fields of each fallback that contain placeholders; every other value is copied as-is.
+_FALLBACK_TEMPLATED = {
+    event_type: frozenset(k for k, v in fallback.items() if isinstance(v, str) and "{" in v)
+    for event_type, fallback in EMBED_FALLBACKS.items()
+}
+
+class _BlankMissing(dict):
+    """format_map mapping that renders placeholders missing from details as empty strings."""
+    def __missing__(self, key):
+        return ""
+
+# The JSON object inside a ```json fenced block, wherever the model put it.
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.S)
+
+def _extract_json(text: str) -> dict:
+    """Parses the JSON object from a Gemini reply, with or without a code fence around it."""
+    match = _JSON_BLOCK.search(text)
+    return orjson.loads(match.group(1) if match else text.strip())
+
+def _fallback_embed(event_type: str, details: dict) -> dict:
+    """Fills the static fallback embed for event_type with details."""
+    templated = _FALLBACK_TEMPLATED.get(event_type, frozenset())
+    fields = _BlankMissing(details) if templated else None
+    return {k: v.format_map(fields) if k in templated else v for k, v in EMBED_FALLBACKS.get(event_type, {}).items()}
+
+# In-memory LRU cache of Gemini responses: key -> (expires_at, value).
+# The same event types and details come up again and again (polls, point awards, reminders),
+# and a hit skips a multi-second round trip to Gemini.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 3600
+_response_cache: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+
+def _cache_get(key: tuple):
+    """Returns the cached value for key, or None if missing or expired."""
+    hit = _response_cache.get(key)
+    if hit is None:
+        return None
+    if hit[0] <= time.monotonic():
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return hit[1]
+
+def _cache_put(key: tuple, value):
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, value)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
 async def generate_announcement_json(event_type: str, details: dict = None) -> dict:
     """
     Generates a JSON object for a Discord embed using the Gemini API.
@@ -38,27 +102,27 @@ async def generate_announcement_json(event_type: str, details: dict = None) -> d
     """
     details = details or {}
     if not ai_model:
-        fallback = EMBED_FALLBACKS.get(event_type, {})
-        return {k: v.format(**details) if isinstance(v, str) else v for k, v in fallback.items()}
+        return _fallback_embed(event_type, details)
 
-    persona_prompt = """
-You are TaskmasterGPT, the grandmaster of clan events for a Discord server.
-Your tone is epic, engaging, and highly detailed.
-Your task is to generate a JSON object for a Discord embed with "title", "description", and "color" keys (as an integer).
-Use vivid language and Discord markdown. Do not use emojis.
-"""
-    specific_prompt = f"Generate an embed for an event of type '{event_type}' with details: {details}"
-
-    full_prompt = f"{persona_prompt}\n\nRequest: {specific_prompt}\n\nJSON Output:"
     try:
+        cache_key = ("announcement", event_type, orjson.dumps(details, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str))
+    except TypeError:
+        cache_key = None  # Details orjson can't serialize just skip the cache
+    cached = _cache_get(cache_key) if cache_key else None
+    if cached is not None:
+        # Callers edit the returned dict (e.g. appending vote tallies), so never hand out the cached one.
+        return copy.deepcopy(cached)
+    try:
+        # Only built on a cache miss
+        full_prompt = ANNOUNCEMENT_PROMPT.format(event_type=event_type, details=details)
         response = await ai_model.generate_content_async(full_prompt)
-        # A more robust way to clean the response
-        clean_json_string = response.text.strip().removeprefix("```json").removesuffix("```")
-        return json.loads(clean_json_string)
+        embed_data = _extract_json(response.text)
+        if cache_key:
+            _cache_put(cache_key, embed_data)
+        return copy.deepcopy(embed_data)
     except Exception as e:
         logger.error(f"Error generating AI announcement for {event_type}: {e}")
-        fallback = EMBED_FALLBACKS.get(event_type, {})
-        return {k: v.format(**details) if isinstance(v, str) else v for k, v in fallback.items()}
+        return _fallback_embed(event_type, details)
 
 async def generate_recap_text(gains_data: list) -> str:
     """Generates a weekly recap summary using the Gemini API."""
@@ -66,8 +130,13 @@ async def generate_recap_text(gains_data: list) -> str:
         return "The Taskmaster is currently reviewing the ledgers. Check back soon."
 
     prompt = f"Write a formal and encouraging weekly OSRS clan recap. Announce the top 3 participants with flair and mention their gains. Data:\n{gains_data[:10]}"
+    cache_key = ("recap", prompt)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
     try:
         response = await ai_model.generate_content_async(prompt)
+        _cache_put(cache_key, response.text)
         return response.text
     except Exception as e:
         logger.error(f"Error generating AI recap: {e}")
@@ -80,8 +149,10 @@ async def generate_osrs_profile_summary(osrs_name: str, skills_data: dict) -> st
     if not ai_model:
         return f"A formidable warrior of Overall Level {overall_level}."
         
-    top_skills = sorted([(k, v['level']) for k, v in skills_data.items() if k != 'overall'], key=lambda item: item[1], reverse=True)[:3]
-    top_skills_str = ", ".join([f"{s.capitalize()} (Lv{l})" for s, l in top_skills])
+    # Extract (skill, level) pairs once and let nlargest keep only the top 3 instead of sorting all of them
+    levels = [(k, v['level']) for k, v in skills_data.items() if k != 'overall']
+    top_skills = heapq.nlargest(3, levels, key=itemgetter(1))
+    top_skills_str = ", ".join([f"{skill_display(s)} (Lv{l})" for s, l in top_skills])
 
     prompt = f"Provide a brief, engaging OSRS character summary (1-2 sentences, no markdown/emojis). Player: {osrs_name}, Overall Level: {overall_level}, Top 3 Skills: {top_skills_str}"
     try:
@@ -2,83 +2,175 @@
 # Utility functions specifically for the bingo cog.
 
 import asyncio
+import io
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
+import functools
 import os
 import discord
-import json
 import logging
+from collections import OrderedDict
 
 from core import config
 
 logger = logging.getLogger(__name__)
 
-def _generate_bingo_image_sync(tasks: list, completed_tasks: list = []) -> tuple[str | None, str | None]:
-    """
-    Synchronous function to generate the bingo board image.
-    Designed to be run in a separate thread to avoid blocking the bot.
-    """
-    try:
-        width, height = 1200, 1200
-        cell_size = width // 5
-        padding = 10
-        img = Image.new('RGB', (width, height), (28, 28, 28)) # Dark grey background
-        draw = ImageDraw.Draw(img)
-
-        try:
-            # Assumes a font file is available. If not, Pillow's default will be used.
-            font_path = "assets/fonts/Roboto-Regular.ttf"
-            title_font = ImageFont.truetype(font_path, 60) if os.path.exists(font_path) else ImageFont.load_default()
-            task_font = ImageFont.truetype(font_path, 22) if os.path.exists(font_path) else ImageFont.load_default()
-        except IOError:
-            logger.warning("Font file not found. Falling back to default font.")
-            title_font = ImageFont.load_default()
-            task_font = ImageFont.load_default()
-
-        # Title
-        draw.text((width / 2, 40), "CLAN BINGO", font=title_font, fill="#FFD700", anchor="mt")
+# Cell background color based on task difficulty.
+DIFFICULTY_COLORS = {"common": "#2E7D32", "uncommon": "#1565C0", "rare": "#C2185B"}
+DEFAULT_CELL_COLOR = "#333333"
 
-        for i, task in enumerate(tasks):
-            row, col = i // 5, i % 5
-            x0, y0 = col * cell_size, (row * cell_size) + 100
-            x1, y1 = x0 + cell_size, y0 + cell_size
+BOARD_SIZE = 1200
+CELL_SIZE = BOARD_SIZE // 5
+BOARD_TOP = 100  # Cells start below the title
 
-            # Draw cell with border
-            draw.rectangle([x0, y0, x1, y1], outline="#4A4A4A", width=2)
+def _cell_box(index: int) -> tuple[int, int, int, int]:
+    """Returns the (left, top, right, bottom) pixel box of a board cell."""
+    row, col = index // 5, index % 5
+    x0, y0 = col * CELL_SIZE, (row * CELL_SIZE) + BOARD_TOP
+    return x0, y0, x0 + CELL_SIZE, y0 + CELL_SIZE
 
-            # Cell background color based on difficulty
-            difficulty_colors = {"common": "#2E7D32", "uncommon": "#1565C0", "rare": "#C2185B"}
-            cell_color = difficulty_colors.get(task.get('difficulty', 'common'), "#333333")
-            draw.rectangle([x0 + 2, y0 + 2, x1 - 2, y1 - 2], fill=cell_color)
+CELL_TEXT_PADDING = 10  # Horizontal padding on each side of a cell's task text
+LINE_SPACING = 4  # Pillow's default multiline spacing
 
-            # Check if task is completed
+@functools.lru_cache(maxsize=1)
+def _load_fonts():
+    """Returns (title_font, task_font), loaded once per process."""
+    try:
+        # Assumes a font file is available. If not, Pillow's default will be used.
+        font_path = "assets/fonts/Roboto-Regular.ttf"
+        title_font = ImageFont.truetype(font_path, 60) if os.path.exists(font_path) else ImageFont.load_default()
+        task_font = ImageFont.truetype(font_path, 22) if os.path.exists(font_path) else ImageFont.load_default()
+    except IOError:
+        logger.warning("Font file not found. Falling back to default font.")
+        title_font = ImageFont.load_default()
+        task_font = ImageFont.load_default()
+    return title_font, task_font
+
+def _wrap_to_width(text: str, font, max_width: float) -> list[str]:
+    """Greedy word wrap using the font's real advance widths; an over-long word gets a line of its own."""
+    space_width = font.getlength(" ")
+    lines = []
+    line = []
+    line_width = 0.0
+    for word in text.split():
+        word_width = font.getlength(word)
+        if line and line_width + space_width + word_width > max_width:
+            lines.append(" ".join(line))
+            line = []
+            line_width = 0.0
+        line_width += (space_width if line else 0) + word_width
+        line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return lines
+
+def _draw_board(tasks: list, completed_tasks) -> Image.Image:
+    """Draws the full bingo board from scratch."""
+    img = Image.new('RGB', (BOARD_SIZE, BOARD_SIZE), (28, 28, 28)) # Dark grey background
+    draw = ImageDraw.Draw(img)
+    title_font, task_font = _load_fonts()
+    ascent, descent = task_font.getmetrics()
+    line_height = ascent + descent
+
+    # Title
+    draw.text((BOARD_SIZE / 2, 40), "CLAN BINGO", font=title_font, fill="#FFD700", anchor="mt")
+
+    for i, task in enumerate(tasks):
+        x0, y0, x1, y1 = _cell_box(i)
+
+        # Draw cell with border
+        draw.rectangle([x0, y0, x1, y1], outline="#4A4A4A", width=2)
+
+        # Cell background color based on difficulty
+        cell_color = DIFFICULTY_COLORS.get(task.get('difficulty', 'common'), DEFAULT_CELL_COLOR)
+        draw.rectangle([x0 + 2, y0 + 2, x1 - 2, y1 - 2], fill=cell_color)
+
+        # Check if task is completed
+        if task['name'] in completed_tasks:
+            # Add a semi-transparent green overlay for completed tasks
+            overlay = Image.new('RGBA', (CELL_SIZE, CELL_SIZE), (0, 255, 0, 100))
+            img.paste(overlay, (x0, y0), overlay)
+            # Draw a checkmark
+            draw.text((x0 + CELL_SIZE - 30, y0 + 10), "✔", font=title_font, fill="#FFFFFF")
+
+        # Wrap text to the cell's pixel width and draw it centred
+        lines = _wrap_to_width(task['name'], task_font, CELL_SIZE - 2 * CELL_TEXT_PADDING)
+        text_width = max((task_font.getlength(line) for line in lines), default=0)
+        text_height = len(lines) * line_height + (len(lines) - 1) * LINE_SPACING
+        text_x = x0 + (CELL_SIZE - text_width) / 2
+        text_y = y0 + (CELL_SIZE - text_height) / 2
+        draw.multiline_text((text_x, text_y), "\n".join(lines), font=task_font, fill="#FFFFFF", align="center", spacing=LINE_SPACING)
+
+    return img
+
+# Rendered boards keyed on their tasks: (all cells pending, all cells completed).
+# A board's tasks are fixed for the whole event, so after the first render an update
+# only copies the pending layer and pastes in the completed cells.
+BOARD_CACHE_SIZE = 4
+_board_cache: OrderedDict[tuple, tuple[Image.Image, Image.Image]] = OrderedDict()
+
+def _board_layers(tasks: list) -> tuple[Image.Image, Image.Image]:
+    key = tuple((t['name'], t.get('difficulty', 'common')) for t in tasks)
+    layers = _board_cache.get(key)
+    if layers is None:
+        all_names = {t['name'] for t in tasks}
+        layers = _board_cache[key] = (_draw_board(tasks, ()), _draw_board(tasks, all_names))
+        while len(_board_cache) > BOARD_CACHE_SIZE:
+            _board_cache.popitem(last=False)
+    return layers
+
+def _generate_bingo_image_sync(tasks: list, completed_tasks: list = []) -> tuple[bytes | None, str | None]:
+    """
+    Synchronous function to generate the bingo board image as PNG bytes.
+    Runs in the bot's worker process pool, so its arguments and result must pickle.
+    """
+    try:
+        pending, completed = _board_layers(tasks)
+        img = pending.copy()
+        completed_tasks = set(completed_tasks)
+        for i, task in enumerate(tasks):
             if task['name'] in completed_tasks:
-                # Add a semi-transparent green overlay for completed tasks
-                overlay = Image.new('RGBA', (cell_size, cell_size), (0, 255, 0, 100))
-                img.paste(overlay, (x0, y0), overlay)
-                # Draw a checkmark
-                draw.text((x0 + cell_size - 30, y0 + 10), "✔", font=title_font, fill="#FFFFFF")
-
-            # Wrap text and draw
-            wrapped_text = textwrap.fill(task['name'], width=20)
-            text_bbox = draw.textbbox((0, 0), wrapped_text, font=task_font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            text_x = x0 + (cell_size - text_width) / 2
-            text_y = y0 + (cell_size - text_height) / 2
-            draw.text((text_x, text_y), wrapped_text, font=task_font, fill="#FFFFFF", align="center")
-
-        output_path = "bingo_board.png"
-        img.save(output_path)
-        return output_path, None
+                box = _cell_box(i)
+                img.paste(completed.crop(box), box[:2])
+
+        # Encode straight to memory: no temp file shared between concurrent updates.
+        # Discord re-encodes uploads anyway, so fast compression beats a smaller file.
+        buf = io.BytesIO()
+        img.save(buf, format="PNG", compress_level=1)
+        return buf.getvalue(), None
     except Exception as e:
         logger.error(f"Error during bingo image generation: {e}", exc_info=True)
         return None, f"Error during image generation: {e}"
 
-async def generate_bingo_image(tasks: list, completed_tasks: list = []) -> tuple[str | None, str | None]:
-    """Asynchronously generates the bingo image by running the sync function in a thread."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _generate_bingo_image_sync, tasks, completed_tasks)
+async def generate_bingo_image(bot, tasks: list, completed_tasks: list = []) -> tuple[io.BytesIO | None, str | None]:
+    """
+    Asynchronously generates the bingo image in the bot's process pool.
+    Pillow's drawing holds the GIL, so a thread would still stall the event loop (and gateway heartbeats).
+    """
+    loop = asyncio.get_running_loop()
+    png, error = await loop.run_in_executor(bot.proc_pool, _generate_bingo_image_sync, tasks, completed_tasks)
+    return (io.BytesIO(png) if png else None), error
+
+# Completed task names last posted for each event. Several members can complete the same
+# tile, and those approvals leave the board unchanged.
+_posted_boards: dict[int, frozenset[str]] = {}
+# Board post embeds by message id, pointed at the attachment. Only the image changes between
+# updates, so after the first fetch the post is edited without reading it back from Discord.
+_board_embeds: dict[int, discord.Embed] = {}
+# Task names on each event's board. The board is fixed once the event starts,
+# so submissions check membership without re-reading board_json.
+_board_task_names: dict[int, frozenset[str]] = {}
+
+async def get_board_task_names(conn, event_id: int) -> frozenset[str]:
+    """Returns the names of the tasks on an event's bingo board, loading them on first use."""
+    task_names = _board_task_names.get(event_id)
+    if task_names is None:
+        board_tasks = await conn.fetchval("SELECT board_json FROM bingo_events WHERE id = $1", event_id)
+        task_names = _board_task_names[event_id] = frozenset(t['name'] for t in board_tasks or ())
+    return task_names
+
+def forget_boards():
+    """Drops the cached board task names, e.g. when the active event is replaced."""
+    _board_task_names.clear()
 
 async def update_bingo_board_post(bot):
     """Fetches the latest bingo data and updates the message with a new image."""
@@ -86,11 +178,16 @@ async def update_bingo_board_post(bot):
         event = await conn.fetchrow("SELECT * FROM bingo_events WHERE is_active = TRUE LIMIT 1")
         if not event: return
 
-        completed_records = await conn.fetch("SELECT task_name FROM bingo_completed_tiles WHERE event_id = $1", event['id'])
+        completed_records = await conn.fetch("SELECT DISTINCT task_name FROM bingo_completed_tiles WHERE event_id = $1", event['id'])
         completed_tasks = [r['task_name'] for r in completed_records]
 
-    board_tasks = json.loads(event['board_json'])
-    image_path, error = await generate_bingo_image(board_tasks, completed_tasks)
+    # Skip rendering, fetching and editing the post when no new tile was completed.
+    board_state = frozenset(completed_tasks)
+    if _posted_boards.get(event['id']) == board_state:
+        return
+
+    board_tasks = event['board_json']
+    image, error = await generate_bingo_image(bot, board_tasks, completed_tasks)
     if error:
         logger.error(f"Failed to generate updated bingo image for event {event['id']}: {error}")
         return
@@ -101,13 +198,20 @@ async def update_bingo_board_post(bot):
         return
 
     try:
-        message = await channel.fetch_message(event['message_id'])
-        with open(image_path, 'rb') as f:
-            new_file = discord.File(f, filename="bingo_board.png")
-            embed = message.embeds[0]
+        embed = _board_embeds.get(event['message_id'])
+        if embed is None:
+            embed = (await channel.fetch_message(event['message_id'])).embeds[0]
             embed.set_image(url="attachment://bingo_board.png")
-            await message.edit(embed=embed, attachments=[new_file])
-        logger.info(f"Successfully updated bingo board for event {event['id']}.")
+            _board_embeds[event['message_id']] = embed
+        message = channel.get_partial_message(event['message_id'])
+        new_file = discord.File(image, filename="bingo_board.png")
+        # Approvals can come in quick succession; only the newest board needs uploading.
+        # The board only counts as posted once the edit lands, so a failed edit is redone next update.
+        bot.outbox.enqueue_edit(
+            message, on_sent=functools.partial(_posted_boards.__setitem__, event['id'], board_state),
+            embed=embed, attachments=[new_file]
+        )
+        logger.info(f"Queued bingo board update for event {event['id']}.")
     except discord.NotFound:
         logger.warning(f"Could not find bingo message {event['message_id']} in channel {channel.id} to update.")
     except Exception as e:
@@ -2,34 +2,72 @@
 # Utilities related to clan management and announcements.
 
 import discord
+import asyncio
 import logging
 from . import ai
 from core import config
 from core.bot_base import GrazyBot
+from core.database import AWARD_POINTS_UPSERT, REMOVE_POINTS_UPSERT
 
 logger = logging.getLogger(__name__)
 
-async def award_points(bot: GrazyBot, member: discord.Member | discord.User, amount: int, reason: str):
+async def award_points(bot: GrazyBot, member: discord.Member | discord.User, amount: int, reason: str) -> int | None:
     """
     Awards clan points to a member, updates the database, and sends them a DM.
+    Returns the member's new balance, or None if nothing was awarded.
     """
     if not member or member.bot:
+        return None
+
+    try:
+        async with bot.db_pool.acquire() as conn:
+            # Create the row or add to it, returning the new balance in one round trip
+            stmt = await conn.statement(AWARD_POINTS_UPSERT)
+            new_balance = await stmt.fetchval(member.id, amount)
+
+        await _send_award_dm(member, amount, reason, new_balance)
+        return new_balance
+    except Exception as e:
+        logger.error(f"An error occurred while awarding points to {member.display_name}: {e}")
+        return None
+
+async def remove_points(bot: GrazyBot, member: discord.Member | discord.User, amount: int) -> int:
+    """Removes up to amount clan points from a member and returns their new balance."""
+    async with bot.db_pool.acquire() as conn:
+        stmt = await conn.statement(REMOVE_POINTS_UPSERT)
+        return await stmt.fetchval(member.id, amount)
+
+async def award_points_bulk(bot: GrazyBot, awards: list[tuple[discord.Member | discord.User, int, str]]):
+    """
+    Awards clan points to several members at once, e.g. competition winners.
+    All balances are updated in a single transaction on one connection, then each member is sent a DM.
+    """
+    awards = [(member, amount, reason) for member, amount, reason in awards if member and not member.bot]
+    if not awards:
         return
 
     try:
         async with bot.db_pool.acquire() as conn:
-            # Ensure the user exists before updating points
-            await conn.execute(
-                "INSERT INTO clan_points (discord_id, points) VALUES ($1, 0) ON CONFLICT (discord_id) DO NOTHING",
-                member.id
-            )
-            # Add points and get the new balance
-            new_balance = await conn.fetchval(
-                "UPDATE clan_points SET points = points + $1 WHERE discord_id = $2 RETURNING points",
-                amount, member.id
-            )
-
-        # Send a confirmation DM to the user
+            async with conn.transaction():
+                stmt = await conn.statement(AWARD_POINTS_UPSERT)
+                await stmt.executemany([(member.id, amount) for member, amount, _ in awards])
+                rows = await conn.fetch(
+                    "SELECT discord_id, points FROM clan_points WHERE discord_id = ANY($1::bigint[])",
+                    list({member.id for member, _, _ in awards})
+                )
+    except Exception as e:
+        logger.error(f"An error occurred while bulk awarding points to {len(awards)} member(s): {e}")
+        return
+
+    balances = {r['discord_id']: r['points'] for r in rows}
+    await asyncio.gather(*(
+        _send_award_dm(member, amount, reason, balances.get(member.id, 0))
+        for member, amount, reason in awards
+    ))
+
+async def _send_award_dm(member: discord.Member | discord.User, amount: int, reason: str, new_balance: int):
+    """Sends a member the points award confirmation DM."""
+    try:
         dm_embed = await ai.generate_announcement_json(
             "points_award",
             {"amount": amount, "reason": reason}
@@ -39,15 +77,15 @@ async def award_points(bot: GrazyBot, member: discord.Member | discord.User, amo
 
         await member.send(embed=embed)
         logger.info(f"Awarded {amount} points to {member.display_name} for: {reason}")
-
     except discord.Forbidden:
         logger.warning(f"Could not send points award DM to {member.display_name}. They may have DMs disabled.")
     except Exception as e:
-        logger.error(f"An error occurred while awarding points to {member.display_name}: {e}")
+        logger.error(f"An error occurred while notifying {member.display_name} of their points award: {e}")
 
-async def send_global_announcement(bot: GrazyBot, event_type: str, details: dict, message_url: str):
+async def send_global_announcement(bot: GrazyBot, event_type: str, details: dict, message_url: str, embed_data: dict = None):
     """
     Sends a standardized, AI-generated announcement to the global announcements channel.
+    Pass embed_data when the caller already generated the embed for this event, to skip a second Gemini call.
     """
     if not config.ANNOUNCEMENTS_CHANNEL_ID:
         logger.warning("ANNOUNCEMENTS_CHANNEL_ID is not set. Cannot send global announcement.")
@@ -59,7 +97,7 @@ async def send_global_announcement(bot: GrazyBot, event_type: str, details: dict
         return
 
     try:
-        ai_embed_data = await ai.generate_announcement_json(event_type, details)
+        ai_embed_data = embed_data or await ai.generate_announcement_json(event_type, details)
         embed = discord.Embed.from_dict(ai_embed_data)
         embed.url = message_url
 
@@ -3,32 +3,144 @@
 
 import aiohttp
 import asyncio
+import bisect
 import logging
+import time
+from array import array
+
+from .wom import backoff_delay, read_json
 
 logger = logging.getLogger(__name__)
 
+MAPPING_ATTEMPTS = 3
+LATEST_PRICES_URL = "https://prices.osrs.cloud/api/v1/latest"
+PRICE_CACHE_TTL = 60
+
+# (expires_at, item id -> latest price entry) for the bulk /latest payload.
+_price_cache: tuple[float, dict] = (0.0, {})
+
+class ItemMapping:
+    """
+    Column-oriented store of the OSRS item catalogue.
+    Keeps parallel arrays instead of one dict per item, with a single
+    lowercase-name -> index dict for lookups.
+    """
+    __slots__ = ("names", "lower_names", "ids", "limits", "members", "icons", "_name_index", "_sorted_names", "_token_index")
+
+    def __init__(self, items: list[dict]):
+        self.names = [item['name'] for item in items]
+        self.lower_names = [name.lower() for name in self.names]
+        self.ids = array('i', (item['id'] for item in items))
+        self.limits = array('i', (item.get('limit') or 0 for item in items))
+        self.icons = [item.get('icon') for item in items]
+        # One bit per item for the members flag.
+        self.members = bytearray((len(items) + 7) // 8)
+        for i, item in enumerate(items):
+            if item.get('members'):
+                self.members[i >> 3] |= 1 << (i & 7)
+        self._name_index = {name: i for i, name in enumerate(self.lower_names)}
+        # Sorted copy of the names so prefix searches are a bisect instead of a scan.
+        self._sorted_names = sorted(self._name_index)
+        # Word -> indexes of the items whose name contains it, for multi-word fuzzy lookups.
+        self._token_index: dict[str, set[int]] = {}
+        for i, name in enumerate(self.lower_names):
+            for token in name.split():
+                self._token_index.setdefault(token, set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def keys(self) -> list[str]:
+        """Returns all lowercase item names, in catalogue order."""
+        return self.lower_names
+
+    def starting_with(self, prefix: str, limit: int) -> list[str]:
+        """Returns up to limit lowercase item names starting with prefix, alphabetically."""
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        matches = []
+        for name in self._sorted_names[start:start + limit]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
+
+    def index(self, name: str) -> int | None:
+        """Returns the catalogue index for an item name (case-insensitive)."""
+        return self._name_index.get(name.lower())
+
+    def search(self, name: str) -> dict | None:
+        """
+        Best-effort lookup for free-typed names: exact name, then the first name with that prefix,
+        then an item containing every word, and only then a scan for the text anywhere in a name.
+        """
+        i = self.index(name)
+        if i is None:
+            name = name.lower()
+            prefixed = self.starting_with(name, 1)
+            if prefixed:
+                i = self._name_index[prefixed[0]]
+        if i is None:
+            word_sets = [self._token_index.get(token, set()) for token in name.split()]
+            common = set.intersection(*word_sets) if word_sets else set()
+            if common:
+                i = min(common)
+        if i is None:
+            i = next((j for j, key in enumerate(self.lower_names) if name in key), None)
+        return self._details(i) if i is not None else None
+
+    def lookup(self, name: str) -> dict | None:
+        """Returns the item's details as a dict, or None if the name is unknown."""
+        i = self.index(name)
+        return self._details(i) if i is not None else None
+
+    def _details(self, i: int) -> dict:
+        return {
+            "id": self.ids[i],
+            "name": self.names[i],
+            "limit": self.limits[i] or None,
+            "members": bool(self.members[i >> 3] & (1 << (i & 7))),
+            "icon": self.icons[i],
+        }
+
 async def load_item_mapping(bot):
     """
     Fetches the OSRS item name-to-ID mapping on startup and stores it in the bot.
     """
     url = "https://prices.osrs.cloud/api/v1/latest/mapping"
-    headers = {'User-Agent': 'GrazyBot/2.0'}
 
-    for attempt in range(3):
+    for attempt in range(MAPPING_ATTEMPTS):
         try:
-            async with aiohttp.ClientSession(headers=headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    # Process the mapping to be lowercase for easier lookups
-                    bot.item_mapping = {item['name'].lower(): item for item in data}
-                    logger.info(f"Successfully loaded {len(bot.item_mapping)} OSRS items into mapping.")
-                    return
+            async with bot.http_session.get(url) as response:
+                response.raise_for_status()
+                data = await read_json(response)
+                bot.item_mapping = ItemMapping(data)
+                logger.info(f"Successfully loaded {len(bot.item_mapping)} OSRS items into mapping.")
+                return
+        except aiohttp.ClientResponseError as e:
+            logger.warning(f"Item mapping request failed with HTTP {e.status} (attempt {attempt+1}/{MAPPING_ATTEMPTS}): {e.message}")
         except aiohttp.ClientError as e:
-            logger.warning(f"Error loading item mapping (attempt {attempt+1}/3): {e}")
-            await asyncio.sleep(5) # Wait before retrying
+            logger.warning(f"Error loading item mapping (attempt {attempt+1}/{MAPPING_ATTEMPTS}): {e}")
         except Exception as e:
             logger.error(f"An unexpected error occurred during item mapping load: {e}")
             break # Exit loop on unexpected error
+        if attempt < MAPPING_ATTEMPTS - 1:
+            await asyncio.sleep(backoff_delay(attempt)) # Wait before retrying
+
+    logger.error("Failed to load OSRS item mapping after multiple attempts. GE commands may not function.")
 
-    logger.error("Failed to load OSRS item mapping after multiple attempts. GE commands may not function.")
\ No newline at end of file
+async def get_latest_prices(bot) -> dict[str, dict]:
+    """
+    Returns the latest prices for every item, keyed by str(item id).
+    One bulk request serves every lookup for PRICE_CACHE_TTL seconds; raises aiohttp.ClientError on failure.
+    """
+    global _price_cache
+    now = time.monotonic()
+    if _price_cache[0] > now:
+        return _price_cache[1]
+    async with bot.http_session.get(LATEST_PRICES_URL) as response:
+        response.raise_for_status()
+        payload = await read_json(response)
+    # The bulk endpoint nests the per-item entries under "data"
+    prices = payload.get("data", payload)
+    _price_cache = (now + PRICE_CACHE_TTL, prices)
+    return prices
@@ -2,15 +2,24 @@
 # OSRS-related constants and helper functions.
 
 import discord
+from typing import Iterable
 
 # --- Constants ---
 
-WOM_SKILLS = [
+WOM_SKILLS = (
     "overall", "attack", "defence", "strength", "hitpoints", "ranged", "prayer",
     "magic", "cooking", "woodcutting", "fletching", "fishing", "firemaking",
     "crafting", "smithing", "mining", "herblore", "agility", "thieving",
     "slayer", "farming", "runecrafting", "hunter", "construction"
-]
+)
+
+# Display names computed once instead of calling capitalize() on every embed build.
+SKILL_DISPLAY = {s: s.capitalize() for s in WOM_SKILLS}
+
+COMBAT_SKILLS = ("attack", "strength", "defence", "ranged", "prayer", "magic", "hitpoints")
+SKILLING_SKILLS = tuple(s for s in WOM_SKILLS if s not in COMBAT_SKILLS and s != "overall")
+# Skills that can be picked for a SOTW poll.
+POLLABLE_SKILLS = tuple(s for s in WOM_SKILLS if s != "overall")
 
 OSRS_ACTIVITIES = [
     "league_points", "bounty_hunter_hunter", "bounty_hunter_rogue",
@@ -32,26 +41,43 @@ OSRS_ACTIVITIES = [
     "vorkath", "wintertodt", "zalcano", "zulrah"
 ]
 
+# Hiscore activity keys -> display names, e.g. 'chambers_of_xeric' -> 'Chambers Of Xeric'.
+ACTIVITY_DISPLAY = {a: a.replace("_", " ").title() for a in OSRS_ACTIVITIES}
+
 MAX_FIELD_LENGTH = 1024
 
 # --- Helper Functions ---
 
-def format_skill_list(skills: list[str], skills_data: dict) -> list[str]:
-    """Formats a list of skills into a string for an embed field."""
+def skill_display(skill_name: str) -> str:
+    """Returns the display name for a skill, e.g. 'woodcutting' -> 'Woodcutting'."""
+    return SKILL_DISPLAY.get(skill_name) or skill_name.capitalize()
+
+def chunk_lines(lines: Iterable[str], limit: int = MAX_FIELD_LENGTH) -> list[str]:
+    """
+    Packs newline-terminated lines into as few blocks as possible, each at most limit characters.
+    Every line stays whole; a single line longer than limit gets a block of its own.
+    """
     output = []
-    current_block = ""
-    for skill_name in skills:
-        if skill_name in skills_data:
-            skill = skills_data[skill_name]
-            line = f"**{skill_name.capitalize()}**: {skill['level']} (XP: {skill['xp']:,})\n"
-            if len(current_block) + len(line) > MAX_FIELD_LENGTH:
-                output.append(current_block)
-                current_block = ""
-            current_block += line
-    if current_block:
-        output.append(current_block)
+    buf = []
+    cur = 0  # Running length of buf, so blocks are joined once instead of re-copied per line.
+    for line in lines:
+        if buf and cur + len(line) > limit:
+            output.append("".join(buf))
+            buf.clear()
+            cur = 0
+        buf.append(line)
+        cur += len(line)
+    if buf:
+        output.append("".join(buf))
     return output
 
+def format_skill_list(skills: tuple[str, ...] | list[str], skills_data: dict, display: dict = SKILL_DISPLAY) -> list[str]:
+    """Formats a list of skills into a string for an embed field."""
+    return chunk_lines(
+        f"**{display.get(name) or name.capitalize()}**: {skills_data[name]['level']} (XP: {skills_data[name]['xp']:,})\n"
+        for name in skills if name in skills_data
+    )
+
 def parse_hiscores_data(data: str) -> tuple[dict, dict]:
     """Parses the raw hiscores data into skills and activities dictionaries."""
     lines = data.strip().split('\\n')
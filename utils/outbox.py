@@ -0,0 +1,73 @@
+# utils/outbox.py
+# Coalesces and paces message edits so bursts of updates don't hit Discord's rate limits.
+
+import asyncio
+import logging
+import discord
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+EDIT_INTERVAL = 1.0  # Seconds between edits in the same channel
+
+class MessageOutbox:
+    """
+    Queues message edits per channel and sends them one at a time.
+    While an edit is waiting its turn, a newer edit of the same message replaces it,
+    so a burst of updates (e.g. poll votes) costs one request per interval rather than one each.
+    discord.py already sleeps through 429s itself; pacing here keeps us from tripping them.
+    """
+
+    def __init__(self, interval: float = EDIT_INTERVAL):
+        self.interval = interval
+        self._pending: dict[int, tuple[discord.Message, dict, Callable[[], None] | None]] = {}  # message id -> latest edit
+        self._queues: dict[int, asyncio.Queue] = {}  # channel id -> message ids awaiting an edit
+        self._workers: dict[int, asyncio.Task] = {}
+
+    def enqueue_edit(self, message: discord.Message, on_sent: Callable[[], None] | None = None, **fields):
+        """
+        Schedules message.edit(**fields), replacing any edit of the message that hasn't been sent yet.
+        on_sent is called once this edit has gone through; it isn't called if the edit fails or is replaced.
+        """
+        queued = message.id in self._pending
+        self._pending[message.id] = (message, fields, on_sent)
+        if queued:
+            return
+        channel_id = message.channel.id
+        queue = self._queues.get(channel_id)
+        if queue is None:
+            queue = self._queues[channel_id] = asyncio.Queue()
+            worker = self._workers[channel_id] = asyncio.create_task(self._drain(queue))
+            worker.add_done_callback(lambda _: self._forget_worker(channel_id, queue))
+        queue.put_nowait(message.id)
+
+    async def _drain(self, queue: asyncio.Queue):
+        while True:
+            message_id = await queue.get()
+            message, fields, on_sent = self._pending.pop(message_id)
+            try:
+                await message.edit(**fields)
+                if on_sent:
+                    on_sent()
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to edit message {message_id}: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error editing message {message_id}: {e}", exc_info=True)
+            await asyncio.sleep(self.interval)
+
+    def _forget_worker(self, channel_id: int, queue: asyncio.Queue):
+        """Drops a stopped worker's queue, so the channel's next edit starts a new worker instead of waiting forever."""
+        if self._queues.get(channel_id) is not queue:
+            return
+        del self._queues[channel_id]
+        self._workers.pop(channel_id, None)
+        while not queue.empty():
+            self._pending.pop(queue.get_nowait(), None)
+
+    def close(self):
+        """Stops the channel workers, dropping any edits that haven't been sent."""
+        for worker in self._workers.values():
+            worker.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        self._pending.clear()
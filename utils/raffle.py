@@ -1,10 +1,11 @@
 # utils/raffle.py
 # Helper functions for the raffle cog.
 
+import asyncio
 import discord
-import random
 import logging
 from core import config
+from core.database import DRAW_RAFFLE_WINNER
 from . import clan
 
 logger = logging.getLogger(__name__)
@@ -26,37 +27,49 @@ async def draw_raffle_winner(bot, raffle_id: int) -> str:
                 return f"Raffle {raffle_id} not found or has already been drawn."
 
             prize = raffle_data['prize']
-            entries = await conn.fetch("SELECT user_id FROM raffle_entries WHERE raffle_id = $1", raffle_id)
+            winner_id = await conn.fetchval(DRAW_RAFFLE_WINNER, raffle_id)
 
-            if not entries:
-                await raffle_channel.send(f"The raffle for **{prize}** has ended, but unfortunately, no one entered.")
+            if winner_id is None:
+                # Record the empty draw before announcing it, so a failed send can't leave conn mid-query.
                 await conn.execute("UPDATE raffles SET winner_id = 0 WHERE id = $1", raffle_id) # Mark as drawn, no winner
+                try:
+                    await raffle_channel.send(f"The raffle for **{prize}** has ended, but unfortunately, no one entered.")
+                except discord.HTTPException as e:
+                    logger.error(f"Raffle {raffle_id} was closed with no entries but the announcement failed: {e}")
+                    return "Raffle ended with no entries, but the announcement could not be sent."
                 return "Raffle ended with no entries."
 
-            winner_id = random.choice([entry['user_id'] for entry in entries])
-            winner_user = await bot.fetch_user(winner_id)
+            winner_user = await bot.get_or_fetch_user(winner_id)
 
-            # Award points to the winner using the centralized function
-            await clan.award_points(bot, winner_user, 50, f"winning the raffle for '{prize}'")
-
-            # Announce in the raffle channel
             win_embed = discord.Embed(
                 title="🎉 Raffle Winner Announcement! 🎉",
                 description=f"Congratulations {winner_user.mention}, you have won **{prize}**!",
                 color=discord.Color.fuchsia()
             )
             win_embed.set_footer(text="May your luck continue!")
-            await raffle_channel.send(content=winner_user.mention, embed=win_embed)
+
+            # Record the winner and award points (and DM the winner) while announcing in the raffle channel.
+            # award_points takes its own pool connection, so this is the only statement on conn.
+            # Let all three finish even if one fails, so a failed send can't hide whether the winner was recorded.
+            recorded, _, win_message = await asyncio.gather(
+                conn.execute("UPDATE raffles SET winner_id = $1 WHERE id = $2", winner_id, raffle_id),
+                clan.award_points(bot, winner_user, 50, f"winning the raffle for '{prize}'"),
+                raffle_channel.send(content=winner_user.mention, embed=win_embed),
+                return_exceptions=True
+            )
+            if isinstance(recorded, Exception):
+                raise recorded
+            if isinstance(win_message, Exception):
+                logger.error(f"Raffle {raffle_id} winner {winner_id} was recorded but the announcement failed: {win_message}")
+                return f"Winner drawn: {winner_user.name}, but the announcement could not be sent."
 
             # Send a global announcement
             await clan.send_global_announcement(
                 bot,
                 "raffle_win",
                 {"winner_name": winner_user.display_name, "prize": prize},
-                raffle_channel.last_message.jump_url if raffle_channel.last_message else ""
+                win_message.jump_url
             )
-
-            await conn.execute("UPDATE raffles SET winner_id = $1 WHERE id = $2", winner_id, raffle_id)
             logger.info(f"Raffle {raffle_id} winner drawn: {winner_user.name} ({winner_id}).")
             return f"Winner drawn: {winner_user.name}."
     except Exception as e:
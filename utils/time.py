@@ -4,6 +4,13 @@
 from datetime import datetime, timezone, timedelta
 import re
 
+_MIN = 60
+_HR = 3600
+_DAY = 86400
+
+_DURATION_RE = re.compile(r"(\d+)\s*([mhd])$")
+_UNIT_SECONDS = {'m': _MIN, 'h': _HR, 'd': _DAY}
+
 def format_timestamp(ts: int, format_type: str = "relative") -> str:
     """
     Formats a UNIX timestamp into a human-readable string.
@@ -18,17 +25,17 @@ def format_timestamp(ts: int, format_type: str = "relative") -> str:
         return dt_object.strftime("%Y-%m-%d %H:%M UTC")
 
     # Relative time calculation
-    delta = datetime.now(timezone.utc) - dt_object
+    total = (datetime.now(timezone.utc) - dt_object).total_seconds()
 
-    if delta.days > 1:
-        return f"{delta.days} days ago"
-    if delta.days == 1:
+    if total >= 2 * _DAY:
+        return f"{int(total // _DAY)} days ago"
+    if total >= _DAY:
         return "1 day ago"
-    if delta.total_seconds() >= 3600:
-        hours = int(delta.total_seconds() // 3600)
+    if total >= _HR:
+        hours = int(total // _HR)
         return f"{hours} hour{'s' if hours > 1 else ''} ago"
-    if delta.total_seconds() >= 60:
-        minutes = int(delta.total_seconds() // 60)
+    if total >= _MIN:
+        minutes = int(total // _MIN)
         return f"{minutes} minute{'s' if minutes > 1 else ''} ago"
     return "Just now"
 
@@ -37,17 +44,8 @@ def parse_duration(duration_str: str) -> timedelta | None:
     Parses a duration string (e.g., '7d', '12h', '30m') into a timedelta object.
     Returns None if the format is invalid.
     """
-    match = re.match(r"(\d+)\s*([mhd])$", duration_str.lower().strip())
+    match = _DURATION_RE.match(duration_str.lower().strip())
     if not match:
         return None
 
-    value, unit = int(match.group(1)), match.group(2)
-
-    if unit == 'm':
-        return timedelta(minutes=value)
-    if unit == 'h':
-        return timedelta(hours=value)
-    if unit == 'd':
-        return timedelta(days=value)
-
-    return None
\ No newline at end of file
+    return timedelta(seconds=int(match.group(1)) * _UNIT_SECONDS[match.group(2)])
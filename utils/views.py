@@ -3,7 +3,9 @@
 
 import discord
 import logging
-from . import ai, clan  # Assuming clan has start_sotw_logic or similar
+from . import ai, bingo, clan  # Assuming clan has start_sotw_logic or similar
+from .osrs import skill_display
+from core.database import INSERT_GIVEAWAY_ENTRY, INSERT_PVM_SIGNUP, DELETE_PVM_SIGNUP, APPROVE_BINGO_SUBMISSION, REJECT_BINGO_SUBMISSION
 
 logger = logging.getLogger(__name__)
 
@@ -14,19 +16,26 @@ class SotwPollView(discord.ui.View):
         super().__init__(timeout=86400)  # Poll lasts 24 hours
         self.author = author
         self.bot = bot_instance
-        self.votes = {skill: [] for skill in skills_to_poll}
+        self.votes = {skill: set() for skill in skills_to_poll}
+        self.user_votes: dict[discord.abc.User, str] = {}  # Reverse index: voter -> skill
         self.add_buttons(skills_to_poll)
         self.callback_function = callback
+        self._base_embed_dict: dict | None = None
+
+    async def prepare(self):
+        """Generates the static poll embed once; every later vote only re-renders the tally."""
+        if self._base_embed_dict is None:
+            self._base_embed_dict = await ai.generate_announcement_json("sotw_poll")
 
     async def create_embed(self) -> discord.Embed:
-        ai_embed_data = await ai.generate_announcement_json("sotw_poll")
-        embed = discord.Embed.from_dict(ai_embed_data)
+        await self.prepare()
+        embed = discord.Embed.from_dict(self._base_embed_dict)
 
         vote_summary = []
         for skill, voters in self.votes.items():
             vote_count = len(voters)
             if vote_count > 0:
-                vote_summary.append(f"**{skill.capitalize()}**: {vote_count} vote(s)")
+                vote_summary.append(f"**{skill_display(skill)}**: {vote_count} vote(s)")
 
         if vote_summary:
             embed.description += "\n\n**Current Votes:**\n" + "\n".join(vote_summary)
@@ -36,27 +45,28 @@ class SotwPollView(discord.ui.View):
 
     def add_buttons(self, skills: list[str]):
         for skill in skills:
-            self.add_item(SotwButton(label=skill.capitalize(), custom_id=f"sotw_vote_{skill}"))
+            self.add_item(SotwButton(label=skill_display(skill), custom_id=f"sotw_vote_{skill}"))
         self.add_item(FinishPollButton(custom_id="finish_sotw_poll"))
 
 class SotwButton(discord.ui.Button):
     async def callback(self, interaction: discord.Interaction):
         user = interaction.user
-        skill_voted_for = self.custom_id.replace("sotw_vote_", "")
+        skill_voted_for = self.custom_id.removeprefix("sotw_vote_")
 
         # Atomically update votes
-        for skill, voters in self.view.votes.items():
-            if user in voters and skill != skill_voted_for:
-                voters.remove(user)
+        previous = self.view.user_votes.pop(user, None)
+        if previous is not None:
+            self.view.votes[previous].discard(user)
 
-        if user in self.view.votes[skill_voted_for]:
-            self.view.votes[skill_voted_for].remove(user)
+        if previous == skill_voted_for:
             await interaction.response.send_message(f"Your vote for **{self.label}** has been removed.", ephemeral=True)
         else:
-            self.view.votes[skill_voted_for].append(user)
+            self.view.votes[skill_voted_for].add(user)
+            self.view.user_votes[user] = skill_voted_for
             await interaction.response.send_message(f"Your vote for **{self.label}** has been counted.", ephemeral=True)
 
-        await interaction.message.edit(embed=await self.view.create_embed())
+        # Votes arrive in bursts; the outbox collapses them into one edit per interval.
+        interaction.client.outbox.enqueue_edit(interaction.message, embed=await self.view.create_embed())
 
 class FinishPollButton(discord.ui.Button):
     def __init__(self, custom_id: str):
@@ -78,9 +88,10 @@ class FinishPollButton(discord.ui.Button):
 
         # Update the message to show the poll has ended
         final_embed = await view.create_embed()
-        final_embed.description += f"\n\n**POLL ENDED! The winning skill is {winner.capitalize()}!**"
+        final_embed.description += f"\n\n**POLL ENDED! The winning skill is {skill_display(winner)}!**"
         final_embed.color = discord.Color.dark_red()
-        await interaction.message.edit(embed=final_embed, view=view)
+        # Through the outbox too, so it replaces (and lands after) any tally edit still waiting.
+        interaction.client.outbox.enqueue_edit(interaction.message, embed=final_embed, view=view)
 
         # Pop from active polls
         view.bot.active_polls.pop(interaction.guild.id, None)
@@ -89,7 +100,7 @@ class FinishPollButton(discord.ui.Button):
         if view.callback_function:
             await view.callback_function(interaction, winner)
 
-        await interaction.response.send_message(f"The poll has been closed. The winning skill is **{winner.capitalize()}**. The SOTW has been started.", ephemeral=True)
+        await interaction.response.send_message(f"The poll has been closed. The winning skill is **{skill_display(winner)}**. The SOTW has been started.", ephemeral=True)
 
 
 # --- PVM Event View ---
@@ -97,8 +108,34 @@ class PvmEventView(discord.ui.View):
     def __init__(self, event_id: int):
         super().__init__(timeout=None)
         self.event_id = event_id
-        self.add_item(discord.ui.Button(label="Sign Up", style=discord.ButtonStyle.green, custom_id=f"pvm_signup_{event_id}"))
-        self.add_item(discord.ui.Button(label="Withdraw", style=discord.ButtonStyle.red, custom_id=f"pvm_withdraw_{event_id}"))
+        self.add_item(PvmSignupButton(label="Sign Up", style=discord.ButtonStyle.green, custom_id=f"pvm_signup_{event_id}"))
+        self.add_item(PvmWithdrawButton(label="Withdraw", style=discord.ButtonStyle.red, custom_id=f"pvm_withdraw_{event_id}"))
+
+class PvmSignupButton(discord.ui.Button):
+    async def callback(self, interaction: discord.Interaction):
+        signed_up = interaction.client.pvm_signups.setdefault(self.view.event_id, set())
+        if interaction.user.id in signed_up:
+            return await interaction.response.send_message("You are already signed up for this event.", ephemeral=True)
+
+        # The unique index on (event_id, user_id) makes a duplicate signup a no-op,
+        # so one statement both checks and inserts.
+        async with interaction.client.db_pool.acquire() as conn:
+            stmt = await conn.statement(INSERT_PVM_SIGNUP)
+            inserted = await stmt.fetchval(self.view.event_id, interaction.user.id)
+        signed_up.add(interaction.user.id)
+        if not inserted:
+            return await interaction.response.send_message("You are already signed up for this event.", ephemeral=True)
+        await interaction.response.send_message("You have signed up for this event!", ephemeral=True)
+
+class PvmWithdrawButton(discord.ui.Button):
+    async def callback(self, interaction: discord.Interaction):
+        async with interaction.client.db_pool.acquire() as conn:
+            stmt = await conn.statement(DELETE_PVM_SIGNUP)
+            deleted = await stmt.fetchval(self.view.event_id, interaction.user.id)
+        interaction.client.pvm_signups.get(self.view.event_id, set()).discard(interaction.user.id)
+        if not deleted:
+            return await interaction.response.send_message("You are not signed up for this event.", ephemeral=True)
+        await interaction.response.send_message("You have withdrawn from this event.", ephemeral=True)
 
 # --- Giveaway View ---
 class GiveawayView(discord.ui.View):
@@ -106,11 +143,67 @@ class GiveawayView(discord.ui.View):
         super().__init__(timeout=None)
         self.message_id = message_id
         self.prize = prize
-        self.add_item(discord.ui.Button(label="Enter Giveaway", emoji="🎉", style=discord.ButtonStyle.primary, custom_id=f"giveaway_enter_{message_id}"))
+        self.add_item(GiveawayEnterButton(label="Enter Giveaway", emoji="🎉", style=discord.ButtonStyle.primary, custom_id=f"giveaway_enter_{message_id}"))
+
+class GiveawayEnterButton(discord.ui.Button):
+    async def callback(self, interaction: discord.Interaction):
+        entered = interaction.client.giveaway_entries.get(interaction.message.id)
+        if entered and interaction.user.id in entered:
+            return await interaction.response.send_message("You have already entered this giveaway.", ephemeral=True)
+
+        # One round trip: find the active giveaway for this message and insert the entry,
+        # letting the unique index on (giveaway_id, user_id) reject duplicates.
+        async with interaction.client.db_pool.acquire() as conn:
+            stmt = await conn.statement(INSERT_GIVEAWAY_ENTRY)
+            result = await stmt.fetchrow(interaction.message.id, interaction.user.id)
+        if not result['is_active']:
+            return await interaction.response.send_message("This giveaway has ended.", ephemeral=True)
+        interaction.client.giveaway_entries.setdefault(interaction.message.id, set()).add(interaction.user.id)
+        if not result['entered']:
+            return await interaction.response.send_message("You have already entered this giveaway.", ephemeral=True)
+        await interaction.response.send_message(f"You have entered the giveaway for **{self.view.prize}**. Good luck!", ephemeral=True)
 
 # --- Bingo Submission View ---
 class SubmissionView(discord.ui.View):
-    def __init__(self):
+    def __init__(self, submission_id: int):
         super().__init__(timeout=None)
-        self.add_item(discord.ui.Button(label="Approve", style=discord.ButtonStyle.green, custom_id="bingo_approve"))
-        self.add_item(discord.ui.Button(label="Reject", style=discord.ButtonStyle.red, custom_id="bingo_reject"))
\ No newline at end of file
+        self.submission_id = submission_id
+        self.add_item(BingoReviewButton(submission_id, approve=True))
+        self.add_item(BingoReviewButton(submission_id, approve=False))
+
+class BingoReviewButton(discord.ui.DynamicItem[discord.ui.Button], template=r"bingo_(?P<action>approve|reject):(?P<id>\d+)"):
+    """
+    Approve/reject button for a bingo submission. The submission id lives in the custom_id,
+    so it is parsed once per click and the button keeps working after a restart.
+    """
+    def __init__(self, submission_id: int, approve: bool):
+        action = "approve" if approve else "reject"
+        super().__init__(discord.ui.Button(
+            label="Approve" if approve else "Reject",
+            style=discord.ButtonStyle.green if approve else discord.ButtonStyle.red,
+            custom_id=f"bingo_{action}:{submission_id}"
+        ))
+        self.submission_id = submission_id
+        self.approve = approve
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match['id']), approve=match['action'] == "approve")
+
+    async def callback(self, interaction: discord.Interaction):
+        if not interaction.user.guild_permissions.manage_events:
+            return await interaction.response.send_message("You don't have permission to review submissions.", ephemeral=True)
+
+        async with interaction.client.db_pool.acquire() as conn:
+            stmt = await conn.statement(APPROVE_BINGO_SUBMISSION if self.approve else REJECT_BINGO_SUBMISSION)
+            submission = await stmt.fetchrow(self.submission_id)
+        if not submission:
+            return await interaction.response.send_message("This submission has already been reviewed.", ephemeral=True)
+
+        status = "approved" if self.approve else "rejected"
+        await interaction.response.edit_message(
+            content=f"Submission {status} by {interaction.user.mention}: **{submission['task_name']}** for <@{submission['user_id']}>.",
+            view=None
+        )
+        if self.approve:
+            await bingo.update_bingo_board_post(interaction.client)
\ No newline at end of file
@@ -2,39 +2,117 @@
 # Helper functions for interacting with the Wise Old Man (WOM) API.
 
 import aiohttp
+import asyncio
+import orjson
+import random
+import time
 from datetime import datetime, timezone, timedelta
 import logging
 
 from core import config
+from .osrs import skill_display
 
 logger = logging.getLogger(__name__)
 BASE_URL = "https://api.wiseoldman.net/v2"
-HEADERS = {"User-Agent": "GrazyBot/2.0"}
 
-async def get_competition_details(competition_id: int) -> tuple[dict | None, str | None]:
+# Caps in-flight WOM requests so bursts (e.g. several competitions ending at once)
+# don't trip WOM's rate limiter.
+MAX_CONCURRENT_REQUESTS = 10
+MAX_ATTEMPTS = 3
+MAX_BACKOFF = 30
+_request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff: roughly 1s, 2s, 4s... capped at MAX_BACKOFF."""
+    return min(MAX_BACKOFF, 2 ** attempt + random.random())
+
+async def read_json(response: aiohttp.ClientResponse):
+    """
+    Decodes a response body with orjson, which parses the raw bytes without a str decode step.
+    A body that isn't JSON raises aiohttp.ContentTypeError, as response.json() would, so callers
+    only need to handle aiohttp.ClientError.
+    """
+    try:
+        return orjson.loads(await response.read())
+    except orjson.JSONDecodeError as e:
+        raise aiohttp.ContentTypeError(
+            response.request_info, response.history, status=response.status, message=f"Invalid JSON body: {e}"
+        ) from e
+
+def _retry_after(response: aiohttp.ClientResponse, attempt: int) -> float:
+    """Seconds to wait before retrying: the Retry-After header if usable, else exponential backoff."""
+    try:
+        return min(MAX_BACKOFF, max(0.0, float(response.headers["Retry-After"])))
+    except (KeyError, ValueError):
+        return backoff_delay(attempt)
+
+async def _request_json(bot, method: str, url: str, **kwargs):
+    """
+    Performs a WOM request through the shared session and returns the decoded JSON.
+    Rate-limited (429) responses are retried after the server's Retry-After delay.
+    Raises aiohttp.ClientError on failure.
+    """
+    async with _request_semaphore:
+        for attempt in range(MAX_ATTEMPTS):
+            async with bot.http_session.request(method, url, **kwargs) as response:
+                if response.status == 429 and attempt < MAX_ATTEMPTS - 1:
+                    delay = _retry_after(response, attempt)
+                    logger.warning(f"WOM rate limited on {url}; retrying in {delay:.1f}s.")
+                else:
+                    response.raise_for_status()
+                    return await read_json(response)
+            await asyncio.sleep(delay)
+
+# Short-lived cache of GET responses keyed on URL: url -> (expires_at, data).
+# WOM data barely changes minute to minute, so bursts of commands share one fetch.
+CACHE_TTL = 120
+COMPETITION_CACHE_TTL = 60  # Ended competitions are polled every event_manager tick
+_response_cache: dict[str, tuple[float, object]] = {}
+
+async def cached_get(bot, url: str, ttl: float = CACHE_TTL):
+    """Returns the JSON for a WOM GET, served from cache if fetched within ttl seconds."""
+    now = time.monotonic()
+    hit = _response_cache.get(url)
+    if hit and hit[0] > now:
+        return hit[1]
+    data = await _request_json(bot, "GET", url)
+    # Drop expired entries on the way in so one-off URLs don't pile up.
+    for stale in [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]:
+        del _response_cache[stale]
+    _response_cache[url] = (now + ttl, data)
+    return data
+
+def invalidate_cache():
+    """Drops all cached WOM responses."""
+    _response_cache.clear()
+
+async def get_competition_details(bot, competition_id: int) -> tuple[dict | None, str | None]:
     """Fetches details for a specific competition."""
     url = f"{BASE_URL}/competitions/{competition_id}"
-    async with aiohttp.ClientSession(headers=HEADERS) as session:
-        try:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                return await response.json(), None
-        except aiohttp.ClientError as e:
-            logger.error(f"WOM API Error fetching competition {competition_id}: {e}")
-            return None, f"API Error: {e}"
-
-async def create_competition(skill: str, duration_days: int) -> tuple[dict | None, str | None]:
-    """Creates a new competition on WOM."""
+    try:
+        return await cached_get(bot, url, COMPETITION_CACHE_TTL), None
+    except aiohttp.ClientError as e:
+        logger.error(f"WOM API Error fetching competition {competition_id}: {e}")
+        return None, f"API Error: {e}"
+
+def competition_window(duration_days: int) -> tuple[datetime, datetime]:
+    """Returns the (start, end) UTC datetimes for a competition starting in one minute."""
+    start_date = datetime.now(timezone.utc) + timedelta(minutes=1)
+    return start_date, start_date + timedelta(days=duration_days)
+
+async def create_competition(bot, skill: str, start_date: datetime, end_date: datetime) -> tuple[dict | None, str | None]:
+    """
+    Creates a new competition on WOM.
+    The caller keeps start_date/end_date, so WOM's ISO timestamps never need parsing back.
+    """
     if not config.WOM_CLAN_ID or not config.WOM_VERIFICATION_CODE:
         logger.error("WOM_CLAN_ID or WOM_VERIFICATION_CODE is not set.")
         return None, "Bot is not configured for WOM competitions."
 
     url = f"{BASE_URL}/competitions"
-    start_date = datetime.now(timezone.utc) + timedelta(minutes=1)
-    end_date = start_date + timedelta(days=duration_days)
 
     payload = {
-        "title": f"{skill.capitalize()} SOTW ({start_date.strftime('%b %d')})",
+        "title": f"{skill_display(skill)} SOTW ({start_date.strftime('%b %d')})",
         "metric": skill,
         "startsAt": start_date.isoformat(),
         "endsAt": end_date.isoformat(),
@@ -42,29 +120,24 @@ async def create_competition(skill: str, duration_days: int) -> tuple[dict | Non
         "groupVerificationCode": config.WOM_VERIFICATION_CODE
     }
 
-    async with aiohttp.ClientSession(headers=HEADERS) as session:
-        try:
-            async with session.post(url, json=payload) as response:
-                response.raise_for_status()
-                data = await response.json()
-                logger.info(f"Successfully created WOM competition: {data.get('competition', {}).get('id')}")
-                return data, None
-        except aiohttp.ClientError as e:
-            logger.error(f"WOM API Error creating competition for {skill}: {e}")
-            return None, f"API Error creating competition: {e}"
-
-async def get_weekly_gains() -> tuple[list | None, str | None]:
+    try:
+        data = await _request_json(bot, "POST", url, json=payload)
+        invalidate_cache()
+        logger.info(f"Successfully created WOM competition: {data.get('competition', {}).get('id')}")
+        return data, None
+    except aiohttp.ClientError as e:
+        logger.error(f"WOM API Error creating competition for {skill}: {e}")
+        return None, f"API Error creating competition: {e}"
+
+async def get_weekly_gains(bot) -> tuple[list | None, str | None]:
     """Fetches the weekly overall gains for the clan."""
     if not config.WOM_CLAN_ID:
         logger.error("WOM_CLAN_ID is not set.")
         return None, "Bot is not configured to fetch clan gains."
 
     url = f"{BASE_URL}/groups/{config.WOM_CLAN_ID}/gained?period=week&metric=overall"
-    async with aiohttp.ClientSession(headers=HEADERS) as session:
-        try:
-            async with session.get(url) as response:
-                response.raise_for_status()
-                return await response.json(), None
-        except aiohttp.ClientError as e:
-            logger.error(f"WOM API Error fetching weekly gains: {e}")
-            return None, f"Error fetching weekly gains: {e}"
\ No newline at end of file
+    try:
+        return await cached_get(bot, url), None
+    except aiohttp.ClientError as e:
+        logger.error(f"WOM API Error fetching weekly gains: {e}")
+        return None, f"Error fetching weekly gains: {e}"
\ No newline at end of file